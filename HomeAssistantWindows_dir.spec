@@ -6,13 +6,11 @@ from PyInstaller.utils.hooks import collect_all, collect_data_files, collect_sub
 
 # Collect data files from packages (all dependencies)
 datas = []
-datas += collect_data_files('aioesphomeapi', include_py_files=False)
 datas += collect_all('pycaw')[0]
 datas += collect_all('comtypes')[0]
 datas += collect_data_files('pymicro_wakeword', include_py_files=False)
 datas += collect_data_files('pyopen_wakeword', include_py_files=False)
 datas += collect_data_files('sounddevice', include_py_files=False)
-datas += collect_all('pygame')[0]
 datas += collect_data_files('webrtcvad', include_py_files=False)
 datas += collect_data_files('zeroconf', include_py_files=False)
 datas += collect_data_files('ifaddr', include_py_files=False)
@@ -30,13 +28,11 @@ datas += [('src', 'src')]
 
 # Collect binaries (all DLLs and libraries)
 binaries = []
-binaries += collect_dynamic_libs('aioesphomeapi')
 binaries += collect_all('pycaw')[1]
 binaries += collect_all('comtypes')[1]
 binaries += collect_dynamic_libs('pymicro_wakeword')
 binaries += collect_dynamic_libs('pyopen_wakeword')
 binaries += collect_dynamic_libs('sounddevice')
-binaries += collect_all('pygame')[1]
 binaries += collect_dynamic_libs('webrtcvad')
 binaries += collect_dynamic_libs('zeroconf')
 binaries += collect_dynamic_libs('ifaddr')
@@ -49,40 +45,16 @@ binaries += collect_dynamic_libs('pystray')
 
 # Hidden imports (only modules that PyInstaller cannot auto-detect)
 hiddenimports = [
-    'aioesphomeapi',
     'sounddevice',
     'numpy',
     'psutil',
-    'pymicro_wakeword',
-    'pyopen_wakeword',
     'webrtcvad',
     'zeroconf',
     'pycaw',
     'PIL',
     'pystray',
     'windows_toasts',
-    'pygame',
-    'pygame.mixer',
-    'pygame.mixer_music',
-    # src modules
-    'src.i18n',
-    'src.core.mdns_discovery',
-    'src.core.esphome_protocol',
-    'src.ui.system_tray_icon',
-    'src.voice.audio_recorder',
-    'src.voice.mpv_player',
-    'src.voice.wake_word',
-    'src.voice.vad',
-    'src.commands.command_executor',
-    'src.commands.system_commands',
-    'src.commands.media_commands',
-    'src.commands.audio_commands',
-    'src.sensors.windows_monitor',
-    'src.notify.announcement',
-    'src.notify.toast_notification',
-    'src.notify.service_entity',
-    'src.ui.main_window',
-    'src.autostart',
+    # src modules are collected by hooks/hook-src.py
     # Zeroconf internal modules (fixes DNS cache KeyError)
     'zeroconf._dns',
     'zeroconf._services',
@@ -124,13 +96,11 @@ hiddenimports = [
 ]
 
 # Collect submodules (only for packages that need it)
-hiddenimports += collect_submodules('aioesphomeapi')
 hiddenimports += collect_all('pycaw')[2]
 hiddenimports += collect_all('comtypes')[2]
 hiddenimports += collect_submodules('pymicro_wakeword')
 hiddenimports += collect_submodules('pyopen_wakeword')
 hiddenimports += collect_submodules('sounddevice')
-hiddenimports += collect_submodules('pygame')
 hiddenimports += collect_submodules('vlc')
 hiddenimports += collect_submodules('webrtcvad')
 hiddenimports += collect_submodules('zeroconf')
@@ -147,7 +117,6 @@ hiddenimports += collect_submodules('aiohttp')
 hiddenimports += collect_submodules('yarl')
 hiddenimports += collect_submodules('multidict')
 hiddenimports += collect_submodules('idna')
-hiddenimports += collect_submodules('pycaw')
 
 a = Analysis(
     ['src\\__main__.py'],
@@ -177,7 +146,7 @@ exe = EXE(
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,  # Enable UPX compression
+    upx=False,  # No UPX: avoids decompressing binaries at every launch
     upx_exclude=[],
     runtime_tmpdir=None,
     console=False,  # No console window (GUI mode)
@@ -196,7 +165,7 @@ coll = COLLECT(
     a.binaries,  # All DLLs and libraries go here
     a.datas,     # All data files go here
     strip=False,
-    upx=True,    # Enable UPX compression for binaries
+    upx=False,   # No UPX: DLLs load without decompression
     upx_exclude=[],
     name='HomeAssistantWindows',
 )
@@ -0,0 +1,19 @@
+"""
+PyInstaller hook for aioesphomeapi
+Replaces --collect-all: only runtime submodules (protobuf, client, connection,
+frame helpers) are bundled, the package ships no data files we need
+"""
+
+from PyInstaller.utils.hooks import collect_submodules
+
+# Command-line tools of aioesphomeapi, never imported by the client
+_CLI_MODULES = (
+    'aioesphomeapi.discover',
+    'aioesphomeapi.log_reader',
+)
+
+# Collect runtime submodules (includes the compiled connection/_frame_helper modules)
+hiddenimports = collect_submodules(
+    'aioesphomeapi',
+    filter=lambda name: name not in _CLI_MODULES,
+)
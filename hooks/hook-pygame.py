@@ -0,0 +1,19 @@
+"""
+PyInstaller hook for pygame
+Only the mixer is used (streaming playback in voice/mpv_player.py), so instead of
+--collect-all we bundle the SDL2 DLLs and the mixer-related submodules
+"""
+
+from PyInstaller.utils.hooks import collect_dynamic_libs, collect_submodules
+
+# SDL2 / SDL2_mixer DLLs - audio playback backend
+binaries = collect_dynamic_libs('pygame')
+
+# pygame/__init__.py imports its core modules directly; only the mixer ones are
+# loaded lazily and need to be listed
+hiddenimports = collect_submodules(
+    'pygame',
+    filter=lambda name: name.startswith(('pygame.mixer', 'pygame._sdl2')),
+)
+
+datas = []
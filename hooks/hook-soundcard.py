@@ -1,15 +1,25 @@
 """
-PyInstaller hook for sounddevice
-Ensures audio device libraries are included
+PyInstaller hook for soundcard
+Only the backend for the current OS is collected
+(sounddevice is covered by the hook shipped with pyinstaller-hooks-contrib)
 """
 
-from PyInstaller.utils.hooks import collect_data_files, collect_submodules, collect_dynamic_libs
+import sys
 
-# Collect sounddevice data files
-datas = collect_data_files('sounddevice')
+from PyInstaller.utils.hooks import collect_data_files, collect_submodules
 
-# Collect all sounddevice submodules
-hiddenimports = collect_submodules('sounddevice')
+if sys.platform == 'win32':
+    _BACKEND = 'mediafoundation'
+elif sys.platform == 'darwin':
+    _BACKEND = 'coreaudio'
+else:
+    _BACKEND = 'pulseaudio'
 
-# Collect dynamic libraries
-binaries = collect_dynamic_libs('sounddevice')
\ No newline at end of file
+# Collect soundcard data files (cffi headers of the backend)
+datas = collect_data_files('soundcard', includes=[f'{_BACKEND}*'])
+
+# Collect only the platform backend submodule
+hiddenimports = collect_submodules(
+    'soundcard',
+    filter=lambda name: name == 'soundcard' or _BACKEND in name,
+)
@@ -0,0 +1,10 @@
+"""
+PyInstaller hook for the src package
+Collects every application module, replacing the per-module --hidden-import list
+(several modules are only imported lazily inside functions)
+"""
+
+from PyInstaller.utils.hooks import collect_submodules
+
+# Application modules (the entry script itself is not a hidden import)
+hiddenimports = collect_submodules('src', filter=lambda name: name != 'src.__main__')
@@ -4,9 +4,6 @@
 from PyInstaller.utils.hooks import is_module_satisfies
 import os
 
-# 获取 webrtcvad 的位置
-import webrtcvad
-
 # 添加 webrtcvad 的二进制文件
 binaries = []
 datas = []
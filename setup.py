@@ -4,22 +4,36 @@ Used to package Home Assistant client for Windows and macOS
 """
 
 import os
+import re
 import sys
 import io
+import glob
+import shutil
+import hashlib
 import platform
+import importlib.metadata
 
 # Set stdout to UTF-8 encoding (fix Windows encoding issue)
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
+from PyInstaller import __version__ as PYINSTALLER_VERSION
 from PyInstaller.__main__ import run
 
-# Import version number
-try:
-    from src import __version__ as APP_VERSION
-except ImportError:
-    APP_VERSION = "0.0.0"
+
+def _read_version() -> str:
+    """Read __version__ from src/__init__.py without importing the package"""
+    try:
+        with open("src/__init__.py", encoding="utf-8") as f:
+            match = re.search(r'__version__\s*=\s*"([^"]+)"', f.read())
+    except OSError:
+        match = None
+    return match.group(1) if match else "0.0.0"
+
+
+# Version number
+APP_VERSION = _read_version()
 
 # Platform detection
 CURRENT_PLATFORM = platform.system()
@@ -41,6 +55,12 @@ else:
     VERSION_FILE = None
     OUTPUT_EXT = ""
 
+# Spec files checked into the repo (kept in sync with get_cli_args()).
+# Specs that PyInstaller writes for CLI builds are never reused.
+ONEFILE_SPEC = "HomeAssistantWindows.spec"
+ONEDIR_SPEC = "HomeAssistantWindows_dir.spec"
+COMMITTED_SPECS = frozenset({ONEFILE_SPEC, ONEDIR_SPEC}) if CURRENT_PLATFORM == "Windows" else frozenset()
+
 # Main program entry point (use __main__.py so relative imports work correctly)
 MAIN_SCRIPT = "src/__main__.py"
 
@@ -49,6 +69,160 @@ if not os.path.exists(MAIN_SCRIPT):
     print(f"Warning: {MAIN_SCRIPT} does not exist, please create the main program first")
     sys.exit(1)
 
+# Optional resource files (checked once; create_version_info() updates HAS_VERSION_FILE)
+HAS_ICON = bool(ICON_FILE) and os.path.exists(ICON_FILE)
+HAS_VERSION_FILE = bool(VERSION_FILE) and os.path.exists(VERSION_FILE)
+
+# PyInstaller arguments shared by every build mode
+COMMON_ARGS = (
+    MAIN_SCRIPT,
+    "--windowed",  # No console window (use GUI)
+    "--name=" + APP_NAME,
+    "--noconfirm",  # Overwrite output directory without asking
+    "--distpath=dist",  # Output directory
+    "--workpath=build",  # Build directory
+    "--additional-hooks-dir=hooks",  # Custom hooks directory (fix webrtcvad issue)
+)
+
+# Common hidden imports (these modules may not be automatically detected)
+COMMON_HIDDEN_IMPORTS = (
+    "--hidden-import=sounddevice",
+    "--hidden-import=numpy",
+    "--hidden-import=psutil",
+    "--hidden-import=webrtcvad",
+    "--hidden-import=zeroconf",
+    "--hidden-import=PIL",
+    # src modules are collected by hooks/hook-src.py, pygame by hooks/hook-pygame.py
+)
+
+# Collect all submodules
+COLLECT_ALL_ARGS = (
+    "--collect-all=pycaw",
+    "--collect-all=comtypes",
+    "--collect-all=pymicro_wakeword",  # Include tensorflowlite_c.dll
+    "--collect-all=pyopen_wakeword",
+)
+
+# Add src directory to Python path
+ADD_DATA_ARG = "--add-data=src;src" if CURRENT_PLATFORM == "Windows" else "--add-data=src:src"
+
+# Exclude unnecessary modules (reduce size)
+EXCLUDED_MODULES = (
+    "--exclude-module=matplotlib",
+    "--exclude-module=pandas",
+    "--exclude-module=scipy",
+    "--exclude-module=pytest",
+    "--exclude-module=numpy.random",
+    "--exclude-module=numpy.fft",
+    "--exclude-module=numpy.linalg",
+    "--exclude-module=numpy.f2py",
+    "--exclude-module=numpy.ma",
+    "--exclude-module=numpy.matrixlib",
+    "--exclude-module=numpy.polynomial",
+    "--exclude-module=numpy.distutils",
+    "--exclude-module=numpy.doc",
+    "--exclude-module=numpy.testing",
+    "--exclude-module=numpy.compat",
+    "--exclude-module=numpy.records",
+    "--exclude-module=numpy._core._multiarray_tests",
+    "--exclude-module=numpy._core._simd",
+    "--exclude-module=numpy._core.memmap",
+    "--exclude-module=numpy._core.defchararray",
+    "--exclude-module=numpy.ctypeslib",
+    "--exclude-module=numpy.version",
+    "--exclude-module=numpy.strings",
+    "--exclude-module=numpy.char",
+    "--exclude-module=numpy.emath",
+    "--exclude-module=numpy.rec",
+    "--exclude-module=win10toast",
+)
+
+# Built artifacts can be cached per source hash (opt-in via --cache), so unchanged sources skip PyInstaller
+BUILD_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "ha-windows-build")
+# Cached builds kept (most recently used first); older entries are removed on store
+BUILD_CACHE_MAX_ENTRIES = 3
+
+
+def compute_source_hash(mode):
+    """
+    Hash every input that affects the build output
+
+    Uses (path, mtime_ns, size) of every file under src/ (all of it is bundled
+    via --add-data), setup.py, hooks/*.py, the committed specs and the
+    icon/version files, plus the Python, PyInstaller and installed package
+    versions, so no file contents have to be read.
+    """
+    paths = {
+        path for path in glob.glob("src/**/*", recursive=True)
+        if os.path.isfile(path) and "__pycache__" not in path
+    }
+    paths.update(glob.glob("hooks/*.py"))
+    paths.update(spec for spec in COMMITTED_SPECS if os.path.exists(spec))
+    paths.add("setup.py")
+    if HAS_ICON:
+        paths.add(ICON_FILE)
+    if HAS_VERSION_FILE:
+        paths.add(VERSION_FILE)
+
+    h = hashlib.sha256(
+        f"{mode}|{CURRENT_PLATFORM}|{APP_VERSION}|{sys.version}|{PYINSTALLER_VERSION}\n".encode("utf-8")
+    )
+    packages = sorted(
+        f"{dist.metadata['Name']}=={dist.version}" for dist in importlib.metadata.distributions()
+    )
+    h.update("\n".join(packages).encode("utf-8"))
+    for path in sorted(paths):
+        st = os.stat(path)
+        h.update(f"{path}|{st.st_mtime_ns}|{st.st_size}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+def restore_cached_build(source_hash, output):
+    """Copy a cached build output into dist/, return True on cache hit"""
+    cached = os.path.join(BUILD_CACHE_DIR, source_hash, os.path.basename(output))
+    if not os.path.exists(cached):
+        return False
+
+    # Drop the previous output so no stale files survive under the cached one
+    if os.path.isdir(output):
+        shutil.rmtree(output)
+    elif os.path.exists(output):
+        os.remove(output)
+
+    os.makedirs("dist", exist_ok=True)
+    if os.path.isdir(cached):
+        shutil.copytree(cached, output)
+    else:
+        shutil.copy2(cached, output)
+    # Mark the entry as recently used so pruning keeps it
+    os.utime(os.path.join(BUILD_CACHE_DIR, source_hash))
+    print(f"Build cache hit ({source_hash[:12]}), skipping PyInstaller")
+    return True
+
+
+def store_cached_build(source_hash, output):
+    """Copy a fresh build output from dist/ into the build cache"""
+    if not os.path.exists(output):
+        return
+
+    cache_dir = os.path.join(BUILD_CACHE_DIR, source_hash)
+    os.makedirs(cache_dir, exist_ok=True)
+    cached = os.path.join(cache_dir, os.path.basename(output))
+    if os.path.isdir(output):
+        shutil.copytree(output, cached, dirs_exist_ok=True)
+    else:
+        shutil.copy2(output, cached)
+    os.utime(cache_dir)
+    prune_build_cache()
+
+
+def prune_build_cache(keep=BUILD_CACHE_MAX_ENTRIES):
+    """Remove all but the keep most recently used entries from the build cache"""
+    entries = [entry for entry in os.scandir(BUILD_CACHE_DIR) if entry.is_dir()]
+    entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    for entry in entries[keep:]:
+        shutil.rmtree(entry.path, ignore_errors=True)
+
 
 def get_platform_specific_args():
     """Get platform-specific PyInstaller arguments"""
@@ -56,9 +230,9 @@ def get_platform_specific_args():
     
     if CURRENT_PLATFORM == "Windows":
         # Windows-specific arguments
-        if ICON_FILE and os.path.exists(ICON_FILE):
+        if HAS_ICON:
             args.append(f"--icon={ICON_FILE}")
-        if VERSION_FILE and os.path.exists(VERSION_FILE):
+        if HAS_VERSION_FILE:
             args.append(f"--version-file={VERSION_FILE}")
         
         # Windows-specific hidden imports
@@ -68,7 +242,6 @@ def get_platform_specific_args():
         "--hidden-import=comtypes",
         "--hidden-import=pystray",
             "--hidden-import=win10toast",
-            "--hidden-import=src.platforms.windows",
         ])
         
     
@@ -76,143 +249,98 @@ def get_platform_specific_args():
     return args
 
 
-def build_exe():
+def get_cli_args(mode_flag, clean=False):
     """
-    Build a single executable file using PyInstaller (one-file mode)
+    Full PyInstaller command line for the given mode ("--onefile" or "--onedir")
+    Only used when no committed spec file applies
     """
-    # Common PyInstaller arguments
-    pyinstaller_args = [
-        MAIN_SCRIPT,
-        "--onefile",  # Package into a single file
-        "--windowed",  # No console window (use GUI)
-        "--name=" + APP_NAME,
-        "--clean",  # Clean temporary files
-        "--noconfirm",  # Overwrite output directory without asking
-        "--distpath=dist",  # Output directory
-        "--workpath=build",  # Build directory
-        "--additional-hooks-dir=hooks",  # Custom hooks directory (fix webrtcvad issue)
-    ]
-    
-    # Add platform-specific arguments
+    pyinstaller_args = [*COMMON_ARGS, mode_flag]
+    if clean:
+        pyinstaller_args.append("--clean")  # Clean temporary files
+
+    # Platform-specific arguments, then shared imports/collections/exclusions
     pyinstaller_args.extend(get_platform_specific_args())
-    
-    # Common hidden imports (these modules may not be automatically detected)
-    pyinstaller_args.extend([
-        "--hidden-import=aioesphomeapi",
-        "--hidden-import=sounddevice",
-        "--hidden-import=numpy",
-        "--hidden-import=psutil",
-        "--hidden-import=pymicro_wakeword",
-        "--hidden-import=pyopen_wakeword",
-        "--hidden-import=webrtcvad",
-        "--hidden-import=zeroconf",
-        "--hidden-import=PIL",
-        "--hidden-import=pygame",
-        "--hidden-import=pygame.mixer",
-        "--hidden-import=pygame.mixer_music",
-        # src module hidden imports (important!)
-        "--hidden-import=src.i18n",
-        "--hidden-import=src.core.mdns_discovery",
-        "--hidden-import=src.core.esphome_protocol",
-        "--hidden-import=src.ui.system_tray_icon",
-        "--hidden-import=src.voice.audio_recorder",
-        "--hidden-import=src.voice.mpv_player",
-        "--hidden-import=src.voice.wake_word",
-        "--hidden-import=src.voice.vad",
-        
-        "--hidden-import=src.commands.command_executor",
-        "--hidden-import=src.commands.system_commands",
-        "--hidden-import=src.commands.media_commands",
-        "--hidden-import=src.commands.audio_commands",
-        "--hidden-import=src.sensors.windows_monitor",
-        "--hidden-import=src.notify.announcement",
-        "--hidden-import=src.notify.toast_notification",
-        "--hidden-import=src.notify.service_entity",
-        "--hidden-import=src.ui.main_window",
-        "--hidden-import=src.autostart",
-        # Platform abstraction layer
-        "--hidden-import=src.platforms",
-        "--hidden-import=src.platforms.base",
-        # Collect all submodules
-        "--collect-all=aioesphomeapi",
-        "--collect-all=pycaw",
-        "--collect-all=comtypes",
-        "--collect-all=pymicro_wakeword",  # Include tensorflowlite_c.dll
-        "--collect-all=pyopen_wakeword",
-        "--collect-all=pygame",  # SDL2_mixer.dll etc - audio playback/volume backend
-        # Add src directory to Python path
-        "--add-data=src;src" if CURRENT_PLATFORM == "Windows" else "--add-data=src:src",
-        # Exclude unnecessary modules (reduce size)
-        "--exclude-module=matplotlib",
-        "--exclude-module=pandas",
-        "--exclude-module=scipy",
-        "--exclude-module=pytest",
-        "--exclude-module=numpy.random",
-        "--exclude-module=numpy.fft",
-        "--exclude-module=numpy.linalg",
-        "--exclude-module=numpy.f2py",
-        "--exclude-module=numpy.ma",
-        "--exclude-module=numpy.matrixlib",
-        "--exclude-module=numpy.polynomial",
-        "--exclude-module=numpy.distutils",
-        "--exclude-module=numpy.doc",
-        "--exclude-module=numpy.testing",
-        "--exclude-module=numpy.compat",
-        "--exclude-module=numpy.records",
-        "--exclude-module=numpy._core._multiarray_tests",
-        "--exclude-module=numpy._core._simd",
-        "--exclude-module=numpy._core.memmap",
-        "--exclude-module=numpy._core.defchararray",
-        "--exclude-module=numpy.ctypeslib",
-        "--exclude-module=numpy.version",
-        "--exclude-module=numpy.strings",
-        "--exclude-module=numpy.char",
-        "--exclude-module=numpy.emath",
-        "--exclude-module=numpy.rec",
-        "--exclude-module=win10toast",
-        "--strip",
-    ])
-
-    # Filter empty arguments
-    pyinstaller_args = [arg for arg in pyinstaller_args if arg]
+    pyinstaller_args.extend(COMMON_HIDDEN_IMPORTS)
+    pyinstaller_args.extend(COLLECT_ALL_ARGS)
+    pyinstaller_args.append(ADD_DATA_ARG)
+    pyinstaller_args.extend(EXCLUDED_MODULES)
+    # No UPX: the bootloader would have to decompress every binary on each launch
+    pyinstaller_args.append("--noupx")
+    if CURRENT_PLATFORM != "Windows":
+        # Strip symbols (Windows MSVC builds have no strip tool)
+        pyinstaller_args.append("--strip")
+    return pyinstaller_args
+
+
+def build_exe(use_cache=False, clean=False):
+    """
+    Build a single executable file using PyInstaller (one-file mode)
+
+    Uses the committed spec file when available, so PyInstaller can reuse the
+    Analysis cache in build/ instead of re-walking the module graph.
+    """
+    output = os.path.join("dist", APP_NAME + OUTPUT_EXT)
+    # Hashing stats every input, so only do it when the cache is in use
+    source_hash = compute_source_hash("onefile") if use_cache else None
+    if use_cache and restore_cached_build(source_hash, output):
+        print(f"Output file: dist/{APP_NAME}{OUTPUT_EXT}")
+        return
+
+    if ONEFILE_SPEC in COMMITTED_SPECS and os.path.exists(ONEFILE_SPEC):
+        pyinstaller_args = [
+            ONEFILE_SPEC,
+            "--noconfirm",  # Overwrite output directory without asking
+            "--distpath=dist",  # Output directory
+            "--workpath=build",  # Build directory
+        ]
+        if clean:
+            pyinstaller_args.append("--clean")
+    else:
+        pyinstaller_args = get_cli_args("--onefile", clean)
 
     print(f"Building {APP_NAME} v{APP_VERSION} for {CURRENT_PLATFORM} (single-file mode)...")
     print(f"PyInstaller arguments: {' '.join(pyinstaller_args)}")
 
     # Run PyInstaller
     run(pyinstaller_args)
+    if use_cache:
+        store_cached_build(source_hash, output)
 
     print(f"\nBuild completed!")
     print(f"Output file: dist/{APP_NAME}{OUTPUT_EXT}")
 
 
-def build_dir():
+def build_dir(use_cache=False, clean=False):
     """
     Build a directory using PyInstaller (one-dir mode)
     Used for creating installer packages
     """
-    # Use spec file for directory mode
-    if CURRENT_PLATFORM == "Windows":
-        spec_file = "HomeAssistantWindows_dir.spec"
-    else:
-        spec_file = f"{APP_NAME}_dir.spec"
-    
-    if not os.path.exists(spec_file):
-        print(f"Error: {spec_file} not found, creating default build...")
-        build_exe()
+    output = os.path.join("dist", APP_NAME)
+    # Hashing stats every input, so only do it when the cache is in use
+    source_hash = compute_source_hash("onedir") if use_cache else None
+    if use_cache and restore_cached_build(source_hash, output):
+        print(f"Output directory: dist/{APP_NAME}/")
         return
-    
-    pyinstaller_args = [
-        spec_file,
-        "--clean",  # Clean temporary files
-        "--noconfirm",  # Overwrite output directory without asking
-    ]
+
+    # Use the committed spec file for directory mode
+    if ONEDIR_SPEC in COMMITTED_SPECS and os.path.exists(ONEDIR_SPEC):
+        pyinstaller_args = [
+            ONEDIR_SPEC,
+            "--noconfirm",  # Overwrite output directory without asking
+        ]
+        if clean:
+            pyinstaller_args.append("--clean")  # Drop cached Analysis results
+    else:
+        print(f"Warning: no committed {ONEDIR_SPEC} for {CURRENT_PLATFORM}, using command line arguments...")
+        pyinstaller_args = get_cli_args("--onedir", clean)
 
     print(f"Building {APP_NAME} v{APP_VERSION} for {CURRENT_PLATFORM} (directory mode)...")
-    print(f"Using spec file: {spec_file}")
+    print(f"PyInstaller arguments: {' '.join(pyinstaller_args)}")
 
     # Run PyInstaller
     run(pyinstaller_args)
+    if use_cache:
+        store_cached_build(source_hash, output)
 
     print(f"\nBuild completed!")
     print(f"Output directory: dist/{APP_NAME}/")
@@ -225,6 +353,8 @@ def create_version_info():
     Create version info file (Windows only)
     Used for Windows exe version information
     """
+    global HAS_VERSION_FILE
+
     if CURRENT_PLATFORM != "Windows":
         print("Version info file is only needed for Windows")
         return
@@ -261,6 +391,7 @@ def create_version_info():
 
     with open("version_info.txt", "w", encoding="utf-8") as f:
         f.write(version_info_content)
+    HAS_VERSION_FILE = True
 
     print("Version info file created: version_info.txt")
 
@@ -290,23 +421,35 @@ def main():
         action="store_true",
         help="Execute all steps (create version info + build single-file)",
     )
+    parser.add_argument(
+        "--clean",
+        action="store_true",
+        help="Clean PyInstaller cache and temporary files before building",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=f"Reuse cached builds from {BUILD_CACHE_DIR} when inputs are unchanged (not for release builds)",
+    )
 
     args = parser.parse_args()
 
     if args.version_info or args.all:
         create_version_info()
 
+    use_cache = args.cache
+
     if args.build or args.all:
-        build_exe()
+        build_exe(use_cache, args.clean)
 
     if args.build_dir:
-        build_dir()
+        build_dir(use_cache, args.clean)
 
     if not any([args.version_info, args.build, args.build_dir, args.all]):
         # Default to build (single-file mode)
         parser.print_help()
         print(f"\nNo arguments specified, executing default build (single-file mode for {CURRENT_PLATFORM})...")
-        build_exe()
+        build_exe(use_cache, args.clean)
 
 
 if __name__ == "__main__":
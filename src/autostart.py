@@ -5,8 +5,16 @@ Handles platform-specific auto-startup (Windows registry, macOS launchd, etc.)
 
 import os
 import sys
+import atexit
+import threading
 from typing import Optional
 
+# winreg only exists on Windows; imported once instead of inside every call
+try:
+    import winreg
+except ImportError:
+    winreg = None
+
 # Import platform abstraction layer
 try:
     from src.platforms import get_platform_instance
@@ -27,26 +35,62 @@ class AutoStartManager:
     REGISTRY_KEY = r"Software\Microsoft\Windows\CurrentVersion\Run"
     APP_NAME = "HomeAssistantWindows"
 
+    # Executable path never changes during the process lifetime, resolve it once
+    if getattr(sys, 'frozen', False):
+        # Running as compiled EXE or App
+        _EXE_PATH: Optional[str] = sys.executable
+    else:
+        # Running in development mode: the Python script path
+        _EXE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '__main__.py'))
+
     @classmethod
     def get_exe_path(cls) -> Optional[str]:
         """
         Get the path to the running executable
         Returns None if not running as frozen (development mode)
         """
-        if getattr(sys, 'frozen', False):
-            # Running as compiled EXE or App
-            return sys.executable
-        else:
-            # Running in development mode
-            # Return the Python script path
-            return os.path.abspath(os.path.join(os.path.dirname(__file__), '__main__.py'))
+        return cls._EXE_PATH
+
+    # Cached is_enabled() result, reset by the Run key watcher thread
+    _cached_enabled: Optional[bool] = None
+    _cache_generation = 0
+    _watcher_started = False
+    _watcher_lock = threading.Lock()
+
+    # Run key handle kept open across calls (see _open_run_key)
+    _run_key = None
+    _run_key_writable = False
+    _run_key_lock = threading.Lock()
 
     @classmethod
     def is_enabled(cls) -> bool:
         """
         Check if auto-startup is enabled
         Returns True if the application is configured for auto-startup
+
+        The result is cached while a registry watcher can invalidate it,
+        so repeated checks don't hit the registry.
         """
+        cached = cls._cached_enabled
+        if cached is not None:
+            return cached
+
+        generation = cls._cache_generation
+        enabled = cls._query_enabled()
+        # Don't store a value that a concurrent change has already invalidated
+        if cls._start_watcher() and generation == cls._cache_generation:
+            cls._cached_enabled = enabled
+        return enabled
+
+    @classmethod
+    def _invalidate_cache(cls) -> None:
+        """Forget the cached auto-startup state"""
+        cls._cache_generation += 1
+        cls._cached_enabled = None
+
+    @classmethod
+    def _query_enabled(cls) -> bool:
+        """Read the auto-startup state (uncached)"""
         if PLATFORM_AVAILABLE:
             try:
                 platform = get_platform_instance()
@@ -63,6 +107,7 @@ class AutoStartManager:
         Enable auto-startup
         Returns True on success, False on failure
         """
+        cls._invalidate_cache()
         if PLATFORM_AVAILABLE:
             try:
                 platform = get_platform_instance()
@@ -79,6 +124,7 @@ class AutoStartManager:
         Disable auto-startup
         Returns True on success, False on failure
         """
+        cls._invalidate_cache()
         if PLATFORM_AVAILABLE:
             try:
                 platform = get_platform_instance()
@@ -95,24 +141,130 @@ class AutoStartManager:
         Toggle auto-startup
         Returns the new state (True if enabled, False if disabled)
         """
-        if cls.is_enabled():
-            cls.disable()
+        cls._invalidate_cache()
+        if PLATFORM_AVAILABLE:
+            try:
+                platform = get_platform_instance()
+                return platform.toggle_autostart()
+            except Exception as e:
+                print(f"Platform abstraction failed: {e}, falling back to legacy")
+        
+        # Fallback to Windows-specific implementation
+        return cls._toggle_windows()
+
+    # ========== Registry change watcher ==========
+
+    @classmethod
+    def _start_watcher(cls) -> bool:
+        """
+        Start the Run key watcher thread (Windows only)
+        Returns True if the watcher is running and the cache may be used
+        """
+        if cls._watcher_started:
+            return True
+        if winreg is None:
             return False
-        else:
-            cls.enable()
+
+        with cls._watcher_lock:
+            if cls._watcher_started:
+                return True
+            try:
+                key = winreg.OpenKey(
+                    winreg.HKEY_LOCAL_MACHINE,
+                    cls.REGISTRY_KEY,
+                    0,
+                    winreg.KEY_NOTIFY
+                )
+            except OSError as e:
+                print(f"Failed to watch auto-startup registry key: {e}")
+                return False
+
+            threading.Thread(
+                target=cls._watch_run_key,
+                args=(key,),
+                name="AutoStartWatcher",
+                daemon=True,
+            ).start()
+            cls._watcher_started = True
             return True
 
+    @classmethod
+    def _watch_run_key(cls, key) -> None:
+        """Block on RegNotifyChangeKeyValue and drop the cache on every change"""
+        import ctypes
+        from ctypes import wintypes
+
+        REG_NOTIFY_CHANGE_LAST_SET = 0x00000004
+        notify = ctypes.WinDLL('advapi32', use_last_error=True).RegNotifyChangeKeyValue
+        notify.argtypes = (wintypes.HKEY, wintypes.BOOL, wintypes.DWORD, wintypes.HANDLE, wintypes.BOOL)
+        notify.restype = wintypes.LONG
+        try:
+            while True:
+                # Synchronous wait: returns once a value under the key is set or deleted
+                result = notify(key.handle, False, REG_NOTIFY_CHANGE_LAST_SET, None, False)
+                cls._invalidate_cache()
+                if result != 0:
+                    break
+        finally:
+            # Without a watcher the cache could go stale, so stop using it
+            cls._watcher_started = False
+            cls._invalidate_cache()
+            key.Close()
+
     # ========== Windows-specific fallback methods ==========
-    
+
+    @classmethod
+    def _open_run_key(cls, write: bool = False):
+        """
+        Get the shared Run key handle, opening it on first use
+        Caller must hold _run_key_lock. Raises OSError if the key
+        cannot be opened with the requested access.
+        """
+        if winreg is None:
+            raise OSError("winreg is not available on this platform")
+        if cls._run_key is not None and (cls._run_key_writable or not write):
+            return cls._run_key
+
+        try:
+            key = winreg.OpenKey(
+                winreg.HKEY_LOCAL_MACHINE,
+                cls.REGISTRY_KEY,
+                0,
+                winreg.KEY_QUERY_VALUE | winreg.KEY_SET_VALUE
+            )
+            writable = True
+        except PermissionError:
+            # HKLM is only writable with admin rights, reading still works
+            if write:
+                raise
+            key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, cls.REGISTRY_KEY)
+            writable = False
+
+        if cls._run_key is None:
+            atexit.register(cls._close_run_key)
+        else:
+            cls._run_key.Close()
+        cls._run_key = key
+        cls._run_key_writable = writable
+        return key
+
+    @classmethod
+    def _close_run_key(cls) -> None:
+        """Close the shared Run key handle (registered with atexit)"""
+        with cls._run_key_lock:
+            if cls._run_key is not None:
+                cls._run_key.Close()
+                cls._run_key = None
+                cls._run_key_writable = False
+
     @classmethod
     def _is_enabled_windows(cls) -> bool:
         """Windows-specific check for auto-startup"""
         try:
-            import winreg
-            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, cls.REGISTRY_KEY) as key:
+            with cls._run_key_lock:
+                key = cls._open_run_key()
                 value, _ = winreg.QueryValueEx(key, cls.APP_NAME)
-                exe_path = cls.get_exe_path()
-                return value == exe_path
+            return value == cls.get_exe_path()
         except (FileNotFoundError, OSError):
             return False
 
@@ -120,17 +272,12 @@ class AutoStartManager:
     def _enable_windows(cls) -> bool:
         """Windows-specific enable auto-startup"""
         try:
-            import winreg
             exe_path = cls.get_exe_path()
             if not exe_path:
                 return False
 
-            with winreg.OpenKey(
-                winreg.HKEY_LOCAL_MACHINE,
-                cls.REGISTRY_KEY,
-                0,
-                winreg.KEY_SET_VALUE
-            ) as key:
+            with cls._run_key_lock:
+                key = cls._open_run_key(write=True)
                 winreg.SetValueEx(
                     key,
                     cls.APP_NAME,
@@ -143,17 +290,38 @@ class AutoStartManager:
             print(f"Failed to enable auto-startup: {e}")
             return False
 
+    @classmethod
+    def _toggle_windows(cls) -> bool:
+        """Windows-specific toggle: one read-modify-write on the shared key"""
+        try:
+            exe_path = cls.get_exe_path()
+            with cls._run_key_lock:
+                key = cls._open_run_key(write=True)
+                try:
+                    value, _ = winreg.QueryValueEx(key, cls.APP_NAME)
+                except FileNotFoundError:
+                    value = None
+
+                if value == exe_path:
+                    winreg.DeleteValue(key, cls.APP_NAME)
+                    return False
+                if exe_path:
+                    winreg.SetValueEx(key, cls.APP_NAME, 0, winreg.REG_SZ, exe_path)
+                return True
+        except OSError:
+            # No write access: same outcome as checking, then enabling/disabling
+            if cls._is_enabled_windows():
+                cls._disable_windows()
+                return False
+            cls._enable_windows()
+            return True
+
     @classmethod
     def _disable_windows(cls) -> bool:
         """Windows-specific disable auto-startup"""
         try:
-            import winreg
-            with winreg.OpenKey(
-                winreg.HKEY_LOCAL_MACHINE,
-                cls.REGISTRY_KEY,
-                0,
-                winreg.KEY_SET_VALUE
-            ) as key:
+            with cls._run_key_lock:
+                key = cls._open_run_key(write=True)
                 winreg.DeleteValue(key, cls.APP_NAME)
             return True
         except (FileNotFoundError, OSError):
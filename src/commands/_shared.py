@@ -0,0 +1,92 @@
+"""
+Shared helpers for the command modules
+Translated result messages and result templates, cached until the language changes
+"""
+
+import functools
+import logging
+from typing import Callable, Dict, Optional, Tuple
+
+from src.i18n import get_i18n
+
+logger = logging.getLogger(__name__)
+
+# i18n is initialised on the first translated message, not at import time
+_i18n = None
+# Translated result messages
+_messages: Dict[str, str] = {}
+# Success result templates per action
+_ok_results: Dict[str, Dict] = {}
+# Other caches holding translated text, dropped together with ours
+_cache_listeners: Tuple[Callable[[], None], ...] = ()
+
+
+def _clear_caches(_language: Optional[str] = None) -> None:
+    """Drop cached translations and result templates after a language change"""
+    _messages.clear()
+    _ok_results.clear()
+    log_error = logger.error
+    for listener in _cache_listeners:
+        try:
+            listener()
+        except Exception as e:
+            log_error("Cache listener %r failed: %r", listener, e)
+
+
+def add_cache_listener(listener: Callable[[], None]) -> None:
+    """Call listener whenever the translations cached by t() are dropped"""
+    global _cache_listeners
+    _cache_listeners += (listener,)
+
+
+def t(key: str) -> str:
+    """Translate key, caching the result until the language changes"""
+    global _i18n
+    message = _messages.get(key)
+    if message is None:
+        if _i18n is None:
+            _i18n = get_i18n()
+            _i18n.add_language_listener(_clear_caches)
+        message = _messages[key] = _i18n.t(key)
+    return message
+
+
+def ok_result(action: str, **extra) -> Dict:
+    """Success result for action (a fresh copy of a cached template) plus any extra fields"""
+    template = _ok_results.get(action)
+    if template is None:
+        template = _ok_results[action] = {
+            'success': True,
+            'message': t('command_executed'),
+            'action': action,
+        }
+    result = template.copy()
+    if extra:
+        result.update(extra)
+    return result
+
+
+def fail_result(error) -> Dict:
+    """Failure result, error is an exception or message"""
+    return {
+        'success': False,
+        'message': t('command_failed'),
+        'error': str(error),
+    }
+
+
+def safe(what: str) -> Callable[[Callable[..., Dict]], Callable[..., Dict]]:
+    """Decorator turning any exception from a command into a logged fail_result()"""
+    def decorator(fn: Callable[..., Dict]) -> Callable[..., Dict]:
+        # Log under the command's own module, as the inline handlers did
+        logger = logging.getLogger(fn.__module__)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs) -> Dict:
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                logger.error("%s failed: %s", what, e)
+                return fail_result(e)
+        return wrapper
+    return decorator
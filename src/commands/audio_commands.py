@@ -4,8 +4,10 @@ Implements cross-platform audio input/output device switching
 """
 
 import logging
+import threading
+from typing import Any, Dict, List, Optional
 
-from src.i18n import get_i18n
+from ._shared import add_cache_listener, ok_result, safe, t
 
 # Import platform abstraction layer
 try:
@@ -15,21 +17,69 @@ except ImportError:
     PLATFORM_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
-_i18n = get_i18n()
+
+
+def _register_device_notifications(callback):
+    """
+    Call callback whenever audio endpoints are added, removed or changed
+    (IMMNotificationClient via pycaw)
+
+    Returns:
+        The (enumerator, client) pair that must be kept alive, or None if
+        notifications are not available on this platform
+    """
+    try:
+        from pycaw.callbacks import MMNotificationClient
+        from pycaw.utils import AudioUtilities
+    except ImportError:
+        return None
+
+    class _DeviceChangeClient(MMNotificationClient):
+        def on_default_device_changed(self, *args):
+            callback()
+
+        def on_device_added(self, *args):
+            callback()
+
+        def on_device_removed(self, *args):
+            callback()
+
+        def on_device_state_changed(self, *args):
+            callback()
+
+        def on_property_value_changed(self, *args):
+            # Device names live in the property store
+            callback()
+
+    try:
+        enumerator = AudioUtilities.GetDeviceEnumerator()
+        client = _DeviceChangeClient()
+        enumerator.RegisterEndpointNotificationCallback(client)
+    except Exception as e:
+        logger.debug("Audio device notifications unavailable: %s", e)
+        return None
+    return enumerator, client
 
 
 class AudioCommands:
     """Audio Device Control Commands (cross-platform)"""
 
+    # Prebuilt list_devices() result (device names as tuples so it can be shared),
+    # dropped on endpoint change notifications and language changes
+    _device_cache: Optional[Dict[str, Any]] = None
+    _device_cache_generation = 0
+    _device_watcher = None
+    _device_watcher_lock = threading.Lock()
+
     def __init__(self):
         """Initialize audio commands with platform abstraction"""
         self._platform = None
         if PLATFORM_AVAILABLE:
             try:
                 self._platform = get_platform_instance()
-                logger.info(f"AudioCommands initialized with {self._platform.get_platform_name()}")
+                logger.info("AudioCommands initialized with %s", self._platform.get_platform_name())
             except Exception as e:
-                logger.warning(f"Failed to initialize platform abstraction: {e}")
+                logger.warning("Failed to initialize platform abstraction: %s", e)
 
     def list_devices(self) -> dict:
         """
@@ -38,23 +88,32 @@ class AudioCommands:
         Returns:
             dict: Device list
         """
+        cached = AudioCommands._device_cache
+        if cached is not None:
+            # Shallow copy: callers get their own dict, the device tuples are immutable
+            return dict(cached)
+
         if self._platform:
             try:
+                generation = AudioCommands._device_cache_generation
                 devices = self._platform.list_audio_devices()
-                logger.info(f"Output devices: {len(devices.get('output_devices', []))}")
-                logger.info(f"Input devices: {len(devices.get('input_devices', []))}")
+                output_devices = devices.get('output_devices', [])
+                input_devices = devices.get('input_devices', [])
+                logger.info("Output devices: %d", len(output_devices))
+                logger.info("Input devices: %d", len(input_devices))
+                AudioCommands._store_device_cache(generation, output_devices, input_devices)
 
                 return {
                     'success': True,
-                    'message': _i18n.t('command_executed'),
+                    'message': t('command_executed'),
                     'action': 'list_audio_devices',
-                    'output_devices': devices.get('output_devices', []),
-                    'input_devices': devices.get('input_devices', [])
+                    'output_devices': tuple(output_devices),
+                    'input_devices': tuple(input_devices)
                 }
             except Exception as e:
-                logger.error(f"Platform audio listing failed: {e}")
+                logger.error("Platform audio listing failed: %s", e)
         
-        # Fallback to direct soundcard usage
+        # Fallback to direct sounddevice usage
         return self._list_devices_soundcard()
 
     def set_audio_output(self, device_name: str) -> dict:
@@ -69,17 +128,12 @@ class AudioCommands:
         """
         if self._platform:
             try:
-                logger.info(f"Set audio output device: {device_name}")
+                logger.info("Set audio output device: %s", device_name)
                 success = self._platform.set_audio_output_device(device_name)
                 if success:
-                    return {
-                        'success': True,
-                        'message': _i18n.t('command_executed'),
-                        'action': 'set_audio_output',
-                        'device': device_name
-                    }
+                    return ok_result('set_audio_output', device=device_name)
             except Exception as e:
-                logger.error(f"Platform audio output failed: {e}")
+                logger.error("Platform audio output failed: %s", e)
         
         # Fallback to placeholder implementation
         return self._set_audio_output_placeholder(device_name)
@@ -96,122 +150,110 @@ class AudioCommands:
         """
         if self._platform:
             try:
-                logger.info(f"Set audio input device: {device_name}")
+                logger.info("Set audio input device: %s", device_name)
                 success = self._platform.set_audio_input_device(device_name)
                 if success:
-                    return {
-                        'success': True,
-                        'message': _i18n.t('command_executed'),
-                        'action': 'set_audio_input',
-                        'device': device_name
-                    }
+                    return ok_result('set_audio_input', device=device_name)
             except Exception as e:
-                logger.error(f"Platform audio input failed: {e}")
+                logger.error("Platform audio input failed: %s", e)
         
         # Fallback to placeholder implementation
         return self._set_audio_input_placeholder(device_name)
 
+    # ========== Device list cache ==========
+
+    @classmethod
+    def _invalidate_device_cache(cls) -> None:
+        """Forget the cached device lists (called from the COM notification thread)"""
+        cls._device_cache_generation += 1
+        cls._device_cache = None
+
+    @classmethod
+    def _store_device_cache(cls, generation: int, output_devices: List[str],
+                            input_devices: List[str]) -> None:
+        """
+        Cache an enumeration result if change notifications are available
+
+        Args:
+            generation: _device_cache_generation read before enumerating
+            output_devices: Output device names
+            input_devices: Input device names
+        """
+        if not (output_devices or input_devices):
+            # Most likely a failed enumeration, retry on the next call
+            return
+        if not cls._watch_devices():
+            return
+        # Skip results that a device change has already made stale
+        if generation == cls._device_cache_generation:
+            cls._device_cache = {
+                'success': True,
+                'message': t('command_executed'),
+                'action': 'list_audio_devices',
+                'output_devices': tuple(output_devices),
+                'input_devices': tuple(input_devices)
+            }
+
+    @classmethod
+    def _watch_devices(cls) -> bool:
+        """Register for device change notifications once, return True if active"""
+        if cls._device_watcher is not None:
+            return True
+        with cls._device_watcher_lock:
+            if cls._device_watcher is None:
+                cls._device_watcher = _register_device_notifications(cls._invalidate_device_cache)
+            return cls._device_watcher is not None
+
     # ========== Fallback methods ==========
 
     @staticmethod
+    @safe('List audio devices')
     def _list_devices_soundcard() -> dict:
-        """List audio devices using soundcard library directly"""
-        try:
-            import sounddevice as sd
+        """List audio devices using sounddevice library directly"""
+        import sounddevice as sd
 
-            # Get all output devices
-            speakers = soundcard.all_speakers()
-            output_devices = [speaker.name for speaker in speakers]
+        generation = AudioCommands._device_cache_generation
+        devices = sd.query_devices()
 
-            # Get all input devices
-            mics = soundcard.all_microphones()
-            input_devices = [mic.name for mic in mics]
+        # Get all output devices
+        output_devices = [d['name'] for d in devices if d['max_output_channels'] > 0]
 
-            logger.info(f"Output devices: {len(output_devices)}")
-            logger.info(f"Input devices: {len(input_devices)}")
+        # Get all input devices
+        input_devices = [d['name'] for d in devices if d['max_input_channels'] > 0]
 
-            return {
-                'success': True,
-                'message': _i18n.t('command_executed'),
-                'action': 'list_audio_devices',
-                'output_devices': output_devices,
-                'input_devices': input_devices
-            }
-        except Exception as e:
-            logger.error(f"Failed to list audio devices: {e}")
-            return {
-                'success': False,
-                'message': _i18n.t('command_failed'),
-                'error': str(e)
-            }
+        logger.info("Output devices: %d", len(output_devices))
+        logger.info("Input devices: %d", len(input_devices))
+        AudioCommands._store_device_cache(generation, output_devices, input_devices)
+
+        return {
+            'success': True,
+            'message': t('command_executed'),
+            'action': 'list_audio_devices',
+            'output_devices': tuple(output_devices),
+            'input_devices': tuple(input_devices)
+        }
 
     @staticmethod
+    @safe('Set audio output')
     def _set_audio_output_placeholder(device_name: str) -> dict:
         """Placeholder for audio output switching"""
-        try:
-            logger.info(f"Set audio output device: {device_name}")
-            # TODO: Actually switch audio output device
-            # This requires calling platform-specific APIs
-            # or reinitializing player with soundcard library
+        logger.info("Set audio output device: %s", device_name)
+        # TODO: Actually switch audio output device
+        # This requires calling platform-specific APIs
+        # or reinitializing player with soundcard library
 
-            return {
-                'success': True,
-                'message': _i18n.t('command_executed'),
-                'action': 'set_audio_output',
-                'device': device_name
-            }
-        except Exception as e:
-            logger.error(f"Failed to set audio output: {e}")
-            return {
-                'success': False,
-                'message': _i18n.t('command_failed'),
-                'error': str(e)
-            }
+        return ok_result('set_audio_output', device=device_name)
 
     @staticmethod
+    @safe('Set audio input')
     def _set_audio_input_placeholder(device_name: str) -> dict:
         """Placeholder for audio input switching"""
-        try:
-            logger.info(f"Set audio input device: {device_name}")
-            # TODO: Actually switch audio input device
-            # Requires reinitializing recorder
-
-            return {
-                'success': True,
-                'message': _i18n.t('command_executed'),
-                'action': 'set_audio_input',
-                'device': device_name
-            }
-        except Exception as e:
-            logger.error(f"Failed to set audio input: {e}")
-            return {
-                'success': False,
-                'message': _i18n.t('command_failed'),
-                'error': str(e)
-            }
-
-
-if __name__ == "__main__":
-    # Test code
-    logging.basicConfig(level=logging.INFO)
-
-    def test_audio_commands():
-        """Test audio commands"""
-        logger.info("Testing audio device control commands")
-
-        commands = AudioCommands()
-
-        # Test list devices
-        result = commands.list_devices()
+        logger.info("Set audio input device: %s", device_name)
+        # TODO: Actually switch audio input device
+        # Requires reinitializing recorder
 
-        if result['success']:
-            logger.info("\nOutput devices:")
-            for i, device in enumerate(result['output_devices'], 1):
-                logger.info(f"  {i}. {device}")
+        return ok_result('set_audio_input', device=device_name)
 
-            logger.info("\nInput devices:")
-            for i, device in enumerate(result['input_devices'], 1):
-                logger.info(f"  {i}. {device}")
 
-    # Run test
-    test_audio_commands()
+# The cached result embeds a translated message
+add_cache_listener(AudioCommands._invalidate_device_cache)
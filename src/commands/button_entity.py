@@ -5,7 +5,8 @@ Exposes commands as button entities in Home Assistant
 
 import logging
 from collections.abc import Iterable
-from typing import Dict, List, Optional, Callable
+from functools import partial
+from typing import Dict, List, NamedTuple, Optional, Callable, Tuple
 
 # pylint: disable=no-name-in-module
 from aioesphomeapi.api_pb2 import (
@@ -14,12 +15,22 @@ from aioesphomeapi.api_pb2 import (
 )
 from google.protobuf import message
 
+from .command_executor import CommandExecutor
+
 logger = logging.getLogger(__name__)
 
+# Shared "no reply" result for handle_message
+_EMPTY_RESPONSE: Tuple[message.Message, ...] = ()
+
 
 class ButtonEntity:
     """Single button entity"""
 
+    __slots__ = (
+        'key', 'name', 'object_id', 'icon', 'command', 'handler',
+        '_entity_def',
+    )
+
     def __init__(
         self,
         key: int,
@@ -36,9 +47,8 @@ class ButtonEntity:
         self.command = command
         self.handler = handler
 
-    def get_entity_definition(self) -> ListEntitiesButtonResponse:
-        """Get entity definition"""
-        return ListEntitiesButtonResponse(
+        # Definition is immutable, build it once
+        self._entity_def = ListEntitiesButtonResponse(
             object_id=self.object_id,
             key=self.key,
             name=self.name,
@@ -46,6 +56,10 @@ class ButtonEntity:
             disabled_by_default=False,
         )
 
+    def get_entity_definition(self) -> ListEntitiesButtonResponse:
+        """Get entity definition"""
+        return self._entity_def
+
     def press(self) -> Dict:
         """Press button"""
         if self.handler:
@@ -53,67 +67,94 @@ class ButtonEntity:
         return {'success': False, 'message': 'No handler'}
 
 
+class ButtonDefinition(NamedTuple):
+    """Static button definition"""
+    key: int
+    name: str
+    object_id: str
+    icon: str
+    command: str
+
+
 class ButtonEntityManager:
     """Button entity manager"""
 
     # Button definitions (key starts from 100 to avoid conflict with sensors)
     # Media control is handled by MediaPlayer entity, only system control buttons here
-    BUTTON_DEFINITIONS = [
+    BUTTON_DEFINITIONS: Tuple[ButtonDefinition, ...] = (
         # System control buttons
-        {'key': 100, 'name': 'Shutdown', 'object_id': 'shutdown', 'icon': 'mdi:power', 'command': 'shutdown'},
-        {'key': 101, 'name': 'Restart', 'object_id': 'restart', 'icon': 'mdi:restart', 'command': 'restart'},
+        ButtonDefinition(100, 'Shutdown', 'shutdown', 'mdi:power', 'shutdown'),
+        ButtonDefinition(101, 'Restart', 'restart', 'mdi:restart', 'restart'),
 
         # Utility buttons
-        {'key': 120, 'name': 'Screenshot', 'object_id': 'screenshot', 'icon': 'mdi:camera', 'command': 'screenshot'},
-    ]
+        ButtonDefinition(120, 'Screenshot', 'screenshot', 'mdi:camera', 'screenshot'),
+    )
+
+    # Keys are small and dense: dispatch through a list indexed by key - _KEY_BASE
+    _KEY_BASE = min(d.key for d in BUTTON_DEFINITIONS)
+    _KEY_SPAN = max(d.key for d in BUTTON_DEFINITIONS) - _KEY_BASE + 1
 
     def __init__(self, command_executor=None):
         """Initialize button manager"""
         self._buttons: Dict[int, ButtonEntity] = {}
-        self._command_executor = command_executor
+        self._button_table: List[Optional[ButtonEntity]] = [None] * self._KEY_SPAN
+        # Created up front so the first button press doesn't pay for the import/setup
+        self._command_executor = command_executor if command_executor is not None else CommandExecutor()
 
         # Create button entities
         self._create_buttons()
+        self._entity_defs: Tuple[ListEntitiesButtonResponse, ...] = tuple(
+            btn.get_entity_definition() for btn in self._buttons.values()
+        )
 
-        logger.info(f"Button entity manager initialized, {len(self._buttons)} buttons total")
+        logger.info("Button entity manager initialized, %d buttons total", len(self._buttons))
 
     def _create_buttons(self) -> None:
         """Create all button entities"""
-        for btn_def in self.BUTTON_DEFINITIONS:
-            button = ButtonEntity(
-                key=btn_def['key'],
-                name=btn_def['name'],
-                object_id=btn_def['object_id'],
-                icon=btn_def['icon'],
-                command=btn_def['command'],
-                handler=lambda cmd=btn_def['command']: self._execute_command(cmd),
+        self._buttons = {
+            btn_def.key: ButtonEntity(
+                key=btn_def.key,
+                name=btn_def.name,
+                object_id=btn_def.object_id,
+                icon=btn_def.icon,
+                command=btn_def.command,
+                handler=partial(self._execute_command, btn_def.command),
             )
-            self._buttons[btn_def['key']] = button
+            for btn_def in self.BUTTON_DEFINITIONS
+        }
+        for key, button in self._buttons.items():
+            self._button_table[key - self._KEY_BASE] = button
 
     def _execute_command(self, command: str) -> Dict:
         """Execute command"""
-        if self._command_executor:
-            return self._command_executor.execute(command)
-        else:
-            # Lazy load command executor
-            from .command_executor import CommandExecutor
-            self._command_executor = CommandExecutor()
-            return self._command_executor.execute(command)
+        return self._command_executor.execute(command)
 
-    def get_entity_definitions(self) -> List[ListEntitiesButtonResponse]:
+    def get_entity_definitions(self) -> Tuple[ListEntitiesButtonResponse, ...]:
         """Get all button entity definitions"""
-        return [btn.get_entity_definition() for btn in self._buttons.values()]
+        return self._entity_defs
+
+    def _handle_button_command(self, msg: ButtonCommandRequest) -> Iterable[message.Message]:
+        """Handle button press"""
+        index = msg.key - self._KEY_BASE
+        button = self._button_table[index] if 0 <= index < self._KEY_SPAN else None
+        if button:
+            logger.info("Button pressed: %s (key=%d)", button.name, msg.key)
+            result = button.press()
+            logger.info("Command execution result: %s", result)
+        else:
+            logger.warning("Unknown button key: %d", msg.key)
+
+        # Button commands don't need to return messages
+        return _EMPTY_RESPONSE
+
+    # Message type -> handler (exact type match, protobuf classes are final)
+    _HANDLERS = {
+        ButtonCommandRequest: _handle_button_command,
+    }
 
     def handle_message(self, msg: message.Message) -> Iterable[message.Message]:
         """Handle button command message"""
-        if isinstance(msg, ButtonCommandRequest):
-            button = self._buttons.get(msg.key)
-            if button:
-                logger.info(f"Button pressed: {button.name} (key={msg.key})")
-                result = button.press()
-                logger.info(f"Command execution result: {result}")
-            else:
-                logger.warning(f"Unknown button key: {msg.key}")
-
-        # Button commands don't need to return messages
-        return []
+        handler = self._HANDLERS.get(type(msg))
+        if handler is None:
+            return _EMPTY_RESPONSE
+        return handler(self, msg)
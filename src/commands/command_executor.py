@@ -3,27 +3,42 @@ Command Executor Main Module
 Responsible for parsing and executing commands from Home Assistant
 """
 
+import datetime
 import logging
+import os
 import platform
+import shlex
 import subprocess
+import threading
 import webbrowser
-from typing import Dict, Callable, Optional
+from typing import Dict, Callable, Optional, Tuple
 
-from .system_commands import SystemCommands
-from .media_commands import MediaCommands
-from .audio_commands import AudioCommands
-
-from src.i18n import get_i18n
+from ._shared import fail_result, safe, t
 
 logger = logging.getLogger(__name__)
-_i18n = get_i18n()
+
+# Shared toaster instance (win10toast)
+_toaster = None
+_toaster_lock = threading.Lock()
+
+
+def _get_toaster():
+    """Get the shared ToastNotifier, creating it on first use"""
+    global _toaster
+    if _toaster is None:
+        with _toaster_lock:
+            if _toaster is None:
+                from win10toast import ToastNotifier
+
+                _toaster = ToastNotifier()
+    return _toaster
 
 
 class CommandExecutor:
     """Windows Command Executor"""
 
     # Command whitelist (security mechanism)
-    ALLOWED_COMMANDS = {
+    ALLOWED_COMMANDS = frozenset({
         # System control commands
         'shutdown', 'restart', 'sleep', 'hibernate', 'lock', 'logoff',
 
@@ -38,66 +53,96 @@ class CommandExecutor:
 
         # Notification commands
         'notify',
-    }
+    })
 
     # Dangerous commands (require user confirmation)
-    DANGEROUS_COMMANDS = {'shutdown', 'restart', 'logoff'}
-
-    def __init__(self):
-        """Initialize command executor"""
-        self._command_handlers: Dict[str, Callable] = {}
-
-        # Initialize sub-command modules
-        self.system_commands = SystemCommands()
-        self.media_commands = MediaCommands()
-        self.audio_commands = AudioCommands()
+    DANGEROUS_COMMANDS = frozenset({'shutdown', 'restart', 'logoff'})
 
-        # Register command handlers
-        self._register_handlers()
-
-        logger.info("Command executor initialized")
-
-    def _register_handlers(self) -> None:
-        """Register command handlers"""
+    # Dispatch table, shared by all instances:
+    # command -> (sub-command module attribute, or None for executor methods; method name)
+    _HANDLER_SPECS: Dict[str, Tuple[Optional[str], str]] = {
         # System control commands
-        self._command_handlers.update({
-            'shutdown': self.system_commands.shutdown,
-            'restart': self.system_commands.restart,
-            'sleep': self.system_commands.sleep,
-            'hibernate': self.system_commands.hibernate,
-            'lock': self.system_commands.lock,
-            'logoff': self.system_commands.logoff,
-        })
+        'shutdown': ('system_commands', 'shutdown'),
+        'restart': ('system_commands', 'restart'),
+        'sleep': ('system_commands', 'sleep'),
+        'hibernate': ('system_commands', 'hibernate'),
+        'lock': ('system_commands', 'lock'),
+        'logoff': ('system_commands', 'logoff'),
 
         # Media control commands
-        self._command_handlers.update({
-            'play_pause': self.media_commands.play_pause,
-            'next': self.media_commands.next,
-            'previous': self.media_commands.previous,
-            'mute': self.media_commands.mute,
-            'volume': self.media_commands.set_volume,
-            'volume_up': self.media_commands.volume_up,
-            'volume_down': self.media_commands.volume_down,
-        })
+        'play_pause': ('media_commands', 'play_pause'),
+        'next': ('media_commands', 'next'),
+        'previous': ('media_commands', 'previous'),
+        'mute': ('media_commands', 'mute'),
+        'volume': ('media_commands', 'set_volume'),
+        'volume_up': ('media_commands', 'volume_up'),
+        'volume_down': ('media_commands', 'volume_down'),
 
         # Audio device commands
-        self._command_handlers.update({
-            'audio_input': self.audio_commands.set_audio_input,
-            'audio_output': self.audio_commands.set_audio_output,
-            'list_audio_devices': self.audio_commands.list_devices,
-        })
+        'audio_input': ('audio_commands', 'set_audio_input'),
+        'audio_output': ('audio_commands', 'set_audio_output'),
+        'list_audio_devices': ('audio_commands', 'list_devices'),
 
         # Application commands
-        self._command_handlers.update({
-            'launch': self._launch_app,
-            'url': self._open_url,
-            'screenshot': self._screenshot,
-        })
+        'launch': (None, '_launch_app'),
+        'url': (None, '_open_url'),
+        'screenshot': (None, '_screenshot'),
 
         # Notification commands
-        self._command_handlers.update({
-            'notify': self._show_notification,
-        })
+        'notify': (None, '_show_notification'),
+    }
+
+    # The dispatch table must match the whitelist exactly (checked at import, not with assert)
+    if _HANDLER_SPECS.keys() != ALLOWED_COMMANDS:
+        raise RuntimeError("CommandExecutor._HANDLER_SPECS does not match ALLOWED_COMMANDS")
+
+    __slots__ = ('_command_handlers', '_system_commands', '_media_commands', '_audio_commands')
+
+    def __init__(self):
+        """Initialize command executor"""
+        # Bound handlers, filled on first use of each command
+        self._command_handlers: Dict[str, Callable] = {}
+
+        # Sub-command modules are imported and created on first use
+        self._system_commands = None
+        self._media_commands = None
+        self._audio_commands = None
+
+        logger.info("Command executor initialized")
+
+    @property
+    def system_commands(self):
+        """System control commands (created on first access)"""
+        if self._system_commands is None:
+            from .system_commands import SystemCommands
+            self._system_commands = SystemCommands()
+        return self._system_commands
+
+    @property
+    def media_commands(self):
+        """Media control commands (created on first access)"""
+        if self._media_commands is None:
+            from .media_commands import MediaCommands
+            self._media_commands = MediaCommands()
+        return self._media_commands
+
+    @property
+    def audio_commands(self):
+        """Audio device commands (created on first access)"""
+        if self._audio_commands is None:
+            from .audio_commands import AudioCommands
+            self._audio_commands = AudioCommands()
+        return self._audio_commands
+
+    def _resolve_handler(self, cmd: str) -> Optional[Callable]:
+        """Bind the handler for cmd from the shared dispatch table and remember it"""
+        # Security check: only whitelisted commands are ever bound
+        if cmd not in self.ALLOWED_COMMANDS:
+            return None
+        owner, method = self._HANDLER_SPECS[cmd]
+        target = self if owner is None else getattr(self, owner)
+        handler = self._command_handlers[cmd] = getattr(target, method)
+        return handler
 
     def execute(self, command_string: str) -> Dict:
         """
@@ -116,159 +161,134 @@ class CommandExecutor:
         """
         try:
             # Parse command
-            parts = command_string.split(':', 1)
-            cmd = parts[0]
-            args = parts[1] if len(parts) > 1 else None
+            idx = command_string.find(':')
+            if idx < 0:
+                cmd, args = command_string, None
+            else:
+                cmd, args = command_string[:idx], command_string[idx + 1:]
 
-            logger.info(f"Executing command: {cmd} (args: {args})")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Executing command: %s (args: %s)", cmd, args)
 
-            # Security check
-            if cmd not in self.ALLOWED_COMMANDS:
+            # Security check: _resolve_handler only binds whitelisted commands
+            handler = self._command_handlers.get(cmd) or self._resolve_handler(cmd)
+            if handler is None:
                 return {
                     'success': False,
-                    'message': _i18n.t('command_not_allowed'),
+                    'message': t('command_not_allowed'),
                     'error': f"Command '{cmd}' is not in whitelist"
                 }
 
             # Dangerous command confirmation
             if cmd in self.DANGEROUS_COMMANDS:
                 # TODO: Implement UI confirmation dialog
-                logger.warning(f"Dangerous command requires confirmation: {cmd}")
+                logger.warning("Dangerous command requires confirmation: %s", cmd)
                 # Currently executing directly, should show confirmation dialog in actual use
 
-            # Find and execute command handler
-            if cmd in self._command_handlers:
-                handler = self._command_handlers[cmd]
-
-                if args is not None:
-                    result = handler(args)
-                else:
-                    result = handler()
-
-                return result
-            else:
-                return {
-                    'success': False,
-                    'message': f"Command handler not found: {cmd}"
-                }
+            # Execute command handler
+            if args is not None:
+                return handler(args)
+            return handler()
 
         except Exception as e:
-            logger.error(f"Command execution failed: {e}", exc_info=True)
-            return {
-                'success': False,
-                'message': _i18n.t('command_failed'),
-                'error': str(e)
-            }
+            logger.error("Command execution failed: %s", e, exc_info=True)
+            return fail_result(e)
 
+    @safe('Launch app')
     def _launch_app(self, app_name: str) -> Dict:
-        """Launch application"""
-        try:
-            subprocess.Popen([app_name], shell=True)
-            return {
-                'success': True,
-                'message': _i18n.t('command_executed'),
-                'app': app_name
-            }
-        except Exception as e:
-            return {
-                'success': False,
-                'message': _i18n.t('command_failed'),
-                'error': str(e)
-            }
-
+        """Launch application, e.g. "notepad C:\\notes.txt" (program, then its arguments)"""
+        # ShellExecute directly on Windows, no intermediate cmd.exe
+        startfile = getattr(os, 'startfile', None)
+        if startfile is not None:
+            # Windows rules: quotes group a path with spaces and are kept on the arguments
+            program, *arguments = shlex.split(app_name, posix=False)
+            startfile(program.strip('"'), arguments=' '.join(arguments))
+        else:
+            subprocess.Popen(shlex.split(app_name))
+        return {
+            'success': True,
+            'message': t('command_executed'),
+            'app': app_name
+        }
+
+    @safe('Open URL')
     def _open_url(self, url: str) -> Dict:
         """Open URL"""
-        try:
-            webbrowser.open(url)
-            return {
-                'success': True,
-                'message': _i18n.t('command_executed'),
-                'url': url
-            }
-        except Exception as e:
-            return {
-                'success': False,
-                'message': _i18n.t('command_failed'),
-                'error': str(e)
-            }
-
+        webbrowser.open(url)
+        return {
+            'success': True,
+            'message': t('command_executed'),
+            'url': url
+        }
+
+    @safe('Screenshot')
     def _screenshot(self, args: Optional[str] = None) -> Dict:
         """Take screenshot"""
-        try:
-            from PIL import ImageGrab
+        from PIL import ImageGrab
 
-            # Take screenshot
-            screenshot = ImageGrab.grab()
+        # Take screenshot
+        screenshot = ImageGrab.grab()
 
-            # Save file
-            if args:
-                filename = args
-            else:
-                import datetime
-                filename = f"screenshot_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+        # Save file
+        if args:
+            filename = args
+        else:
+            filename = f"screenshot_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
 
-            screenshot.save(filename)
+        screenshot.save(filename)
 
-            return {
-                'success': True,
-                'message': _i18n.t('command_executed'),
-                'file': filename
-            }
-        except Exception as e:
-            return {
-                'success': False,
-                'message': _i18n.t('command_failed'),
-                'error': str(e)
-            }
+        return {
+            'success': True,
+            'message': t('command_executed'),
+            'file': filename
+        }
 
+    @safe('Notification')
     def _show_notification(self, args: str) -> Dict:
         """Show notification"""
-        try:
-            # Parse arguments: "title:message:duration"
-            parts = args.split(':', 2)
+        # Parse arguments: "title:message:duration"
+        parts = args.split(':', 2)
 
-            title = parts[0] if len(parts) > 0 else "Home Assistant"
-            message = parts[1] if len(parts) > 1 else ""
-            duration = int(parts[2]) if len(parts) > 2 else 5
+        title = parts[0] if len(parts) > 0 else "Home Assistant"
+        message = parts[1] if len(parts) > 1 else ""
+        duration = int(parts[2]) if len(parts) > 2 else 5
 
-            if platform.system() == "Windows":
-                from win10toast import ToastNotifier
+        if platform.system() == "Windows":
+            from win10toast import ToastNotifier
 
+            toaster = _get_toaster()
+            if toaster.notification_active():
+                # One toast per notifier at a time: don't drop overlapping notifications
                 toaster = ToastNotifier()
-                toaster.show_toast(
-                    title=title,
-                    msg=message,
-                    duration=duration,
-                    threaded=True,
-                )
-            else:
-                from src.notify.toast_notification import get_notification_handler, Notification
-
-                handler = get_notification_handler()
-                ok = handler.show(Notification(title=title, message=message, duration=duration))
-                if not ok:
-                    return {
-                        'success': False,
-                        'message': _i18n.t('command_failed'),
-                        'error': 'Notification backend unavailable'
-                    }
-
-            return {
-                'success': True,
-                'message': _i18n.t('command_executed')
-            }
-        except Exception as e:
-            return {
-                'success': False,
-                'message': _i18n.t('command_failed'),
-                'error': str(e)
-            }
+            toaster.show_toast(
+                title=title,
+                msg=message,
+                duration=duration,
+                threaded=True,
+            )
+        else:
+            from src.notify.toast_notification import get_notification_handler, Notification
+
+            handler = get_notification_handler()
+            ok = handler.show(Notification(title=title, message=message, duration=duration))
+            if not ok:
+                return fail_result('Notification backend unavailable')
+
+        return {
+            'success': True,
+            'message': t('command_executed')
+        }
 
     def list_available_commands(self) -> list[str]:
         """List all available commands"""
         return list(self.ALLOWED_COMMANDS)
 
 
+# Shared executor for the convenience function
+_default_executor: Optional[CommandExecutor] = None
+_default_executor_lock = threading.Lock()
+
+
 # Convenience function
 def execute_command(command_string: str) -> Dict:
     """
@@ -280,30 +300,9 @@ def execute_command(command_string: str) -> Dict:
     Returns:
         Dict: Execution result
     """
-    executor = CommandExecutor()
-    return executor.execute(command_string)
-
-
-if __name__ == "__main__":
-    # Test code
-    logging.basicConfig(level=logging.INFO)
-
-    def test_executor():
-        """Test command executor"""
-        logger.info("Testing command executor")
-
-        executor = CommandExecutor()
-
-        # Test list commands
-        commands = executor.list_available_commands()
-        logger.info(f"Available commands ({len(commands)}):")
-        for cmd in sorted(commands):
-            logger.info(f"  - {cmd}")
-
-        # Test safe command
-        logger.info("\nTesting safe command:")
-        result = executor.execute("url:https://www.home-assistant.io")
-        logger.info(f"Result: {result}")
-
-    # Run test
-    test_executor()
+    global _default_executor
+    if _default_executor is None:
+        with _default_executor_lock:
+            if _default_executor is None:
+                _default_executor = CommandExecutor()
+    return _default_executor.execute(command_string)
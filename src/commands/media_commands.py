@@ -4,16 +4,117 @@ Implements media playback control commands (play/pause, volume, etc.)
 """
 
 import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Optional
 
-from src.i18n import get_i18n
+from ._shared import fail_result, ok_result
+from .audio_commands import _register_device_notifications
 
 logger = logging.getLogger(__name__)
-_i18n = get_i18n()
+
+# Volume changes run on one COM-initialised daemon thread that keeps the
+# speaker endpoint's IAudioEndpointVolume; COM pointers must stay on that thread.
+# A daemon thread (not a ThreadPoolExecutor worker) so a hung COM call can't block exit.
+_volume_queue: Optional[queue.SimpleQueue] = None
+_volume_queue_lock = threading.Lock()
+_volume_interface = None
+_com_initialized = False
+# Endpoint notifications ((enumerator, client), False if unavailable) mark the
+# cached interface stale, e.g. when the user switches the default output device
+_device_watcher = None
+_volume_interface_stale = False
+
+
+def _mark_volume_interface_stale():
+    """Device notification callback: look the speaker endpoint up again on next use"""
+    global _volume_interface_stale
+    _volume_interface_stale = True
+
+
+def _endpoint_volume():
+    """
+    The default speaker's IAudioEndpointVolume (volume worker thread only)
+    Cached until an endpoint notification arrives; looked up on every call
+    when notifications are not available.
+    """
+    global _volume_interface, _volume_interface_stale, _com_initialized, _device_watcher
+    if not _com_initialized:
+        import comtypes
+        comtypes.CoInitialize()
+        _com_initialized = True
+    if _device_watcher is None:
+        _device_watcher = _register_device_notifications(_mark_volume_interface_stale) or False
+    if _volume_interface is None or _volume_interface_stale or not _device_watcher:
+        # Clear the flag first so a change during the lookup is not lost
+        _volume_interface_stale = False
+        from pycaw.pycaw import AudioUtilities
+        _volume_interface = AudioUtilities.GetSpeakers().EndpointVolume
+    return _volume_interface
+
+
+def _set_master_volume(volume: int) -> None:
+    """Set the master volume scalar (runs on the volume worker thread)"""
+    global _volume_interface
+    try:
+        _endpoint_volume().SetMasterVolumeLevelScalar(volume / 100.0, None)
+    except Exception:
+        # Endpoint may have gone away, look it up again next time
+        _volume_interface = None
+        raise
+
+
+def _step_master_volume(delta: int) -> int:
+    """Move the master volume by delta percent from its current level and return the new level
+    (runs on the volume worker thread)"""
+    global _volume_interface
+    try:
+        endpoint = _endpoint_volume()
+        current = round(endpoint.GetMasterVolumeLevelScalar() * 100)
+        volume = max(0, min(100, current + delta))
+        endpoint.SetMasterVolumeLevelScalar(volume / 100.0, None)
+    except Exception:
+        _volume_interface = None
+        raise
+    return volume
+
+
+def _volume_worker(jobs: queue.SimpleQueue) -> None:
+    """Run queued volume calls forever, reporting each outcome through its future"""
+    while True:
+        future, fn, args = jobs.get()
+        if not future.set_running_or_notify_cancel():
+            continue
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+
+def _run_on_volume_thread(fn: Callable, *args) -> Future:
+    """Queue fn(*args) for the volume worker, starting it on first use"""
+    global _volume_queue
+    if _volume_queue is None:
+        with _volume_queue_lock:
+            if _volume_queue is None:
+                jobs = queue.SimpleQueue()
+                threading.Thread(target=_volume_worker, args=(jobs,), name='volume', daemon=True).start()
+                _volume_queue = jobs
+    future = Future()
+    _volume_queue.put((future, fn, args))
+    return future
 
 
 class MediaCommands:
     """Media Control Commands"""
 
+    # Percent per volume_up/volume_down step
+    VOLUME_STEP = 10
+    # Seconds the volume worker waits for further volume_up/volume_down steps before applying them
+    VOLUME_FLUSH_DELAY = 0.05
+
     def __init__(self):
         """Initialize media control commands"""
         # TODO: Integrate actual media control system
@@ -22,6 +123,12 @@ class MediaCommands:
         self._is_muted = False
         self._volume = 50
 
+        # Pending volume_up/volume_down steps: net change in percent, applied to the real
+        # level by one job on the volume worker (queued while _flush_queued is set)
+        self._pending_step = 0
+        self._flush_queued = False
+        self._flush_lock = threading.Lock()
+
     def play_pause(self) -> dict:
         """
         Toggle play/pause
@@ -29,30 +136,17 @@ class MediaCommands:
         Returns:
             dict: Execution result
         """
-        try:
-            self._is_playing = not self._is_playing
-            action = "play" if self._is_playing else "pause"
-
-            logger.info(f"Media {action}")
-
-            # TODO: Actual media control
-            # Can use Windows media key simulation
-            # import pyautogui
-            # pyautogui.press('playpause')
-
-            return {
-                'success': True,
-                'message': _i18n.t('command_executed'),
-                'action': 'play_pause',
-                'playing': self._is_playing
-            }
-        except Exception as e:
-            logger.error(f"Play/pause failed: {e}")
-            return {
-                'success': False,
-                'message': _i18n.t('command_failed'),
-                'error': str(e)
-            }
+        self._is_playing = not self._is_playing
+        action = "play" if self._is_playing else "pause"
+
+        logger.info("Media %s", action)
+
+        # TODO: Actual media control
+        # Can use Windows media key simulation
+        # import pyautogui
+        # pyautogui.press('playpause')
+
+        return ok_result('play_pause', playing=self._is_playing)
 
     def next(self) -> dict:
         """
@@ -61,25 +155,13 @@ class MediaCommands:
         Returns:
             dict: Execution result
         """
-        try:
-            logger.info("Next track")
+        logger.info("Next track")
 
-            # TODO: Simulate next track key
-            # import pyautogui
-            # pyautogui.press('nexttrack')
+        # TODO: Simulate next track key
+        # import pyautogui
+        # pyautogui.press('nexttrack')
 
-            return {
-                'success': True,
-                'message': _i18n.t('command_executed'),
-                'action': 'next'
-            }
-        except Exception as e:
-            logger.error(f"Next track failed: {e}")
-            return {
-                'success': False,
-                'message': _i18n.t('command_failed'),
-                'error': str(e)
-            }
+        return ok_result('next')
 
     def previous(self) -> dict:
         """
@@ -88,25 +170,13 @@ class MediaCommands:
         Returns:
             dict: Execution result
         """
-        try:
-            logger.info("Previous track")
+        logger.info("Previous track")
 
-            # TODO: Simulate previous track key
-            # import pyautogui
-            # pyautogui.press('prevtrack')
+        # TODO: Simulate previous track key
+        # import pyautogui
+        # pyautogui.press('prevtrack')
 
-            return {
-                'success': True,
-                'message': _i18n.t('command_executed'),
-                'action': 'previous'
-            }
-        except Exception as e:
-            logger.error(f"Previous track failed: {e}")
-            return {
-                'success': False,
-                'message': _i18n.t('command_failed'),
-                'error': str(e)
-            }
+        return ok_result('previous')
 
     def mute(self) -> dict:
         """
@@ -115,29 +185,16 @@ class MediaCommands:
         Returns:
             dict: Execution result
         """
-        try:
-            self._is_muted = not self._is_muted
-            action = "mute" if self._is_muted else "unmute"
+        self._is_muted = not self._is_muted
+        action = "mute" if self._is_muted else "unmute"
 
-            logger.info(action)
+        logger.info(action)
 
-            # TODO: Actual mute control
-            # import pyautogui
-            # pyautogui.press('volumemute')
+        # TODO: Actual mute control
+        # import pyautogui
+        # pyautogui.press('volumemute')
 
-            return {
-                'success': True,
-                'message': _i18n.t('command_executed'),
-                'action': 'mute',
-                'muted': self._is_muted
-            }
-        except Exception as e:
-            logger.error(f"Mute failed: {e}")
-            return {
-                'success': False,
-                'message': _i18n.t('command_failed'),
-                'error': str(e)
-            }
+        return ok_result('mute', muted=self._is_muted)
 
     def set_volume(self, volume_str: str) -> dict:
         """
@@ -149,150 +206,99 @@ class MediaCommands:
         Returns:
             dict: Execution result
         """
+        # Fast path for plain decimal digits (isdigit() would also accept '²', which int() rejects);
+        # signed values ("-5", "+40") still go through int()
+        value = volume_str.strip()
+        if value.isdecimal():
+            volume = int(value)
+        else:
+            try:
+                volume = int(value)
+            except ValueError:
+                return self._invalid_volume(volume_str)
+        volume = 0 if volume < 0 else 100 if volume > 100 else volume
+
+        self._volume = volume
+        logger.info("Set volume: %s", volume)
+
+        self._apply_volume(volume)
+
+        return ok_result('set_volume', volume=volume)
+
+    @staticmethod
+    def _apply_volume(volume: int) -> None:
+        """Set the system master volume (0-100), waiting up to 5 seconds"""
         try:
-            volume = int(volume_str)
-            volume = max(0, min(100, volume))
-
-            self._volume = volume
-            logger.info(f"Set volume: {volume}")
-
-            # Use threading to avoid COM threading issues
-            import threading
-
-            success = [False]  # Use list to allow modification in thread
-            error_msg = [None]
-
-            def set_volume_in_thread():
-                try:
-                    import comtypes
-                    # Initialize COM in this thread
-                    comtypes.CoInitialize()
-
-                    from pycaw.pycaw import AudioUtilities
-                    devices = AudioUtilities.GetSpeakers()
-                    interface = devices.EndpointVolume
-                    interface.SetMasterVolumeLevelScalar(volume / 100.0, None)
-
-                    success[0] = True
-                    logger.info(f"System volume set to {volume}%")
-
-                    # Uninitialize COM
-                    comtypes.CoUninitialize()
-                except Exception as e:
-                    error_msg[0] = str(e)
-                    logger.error(f"Failed to set system volume: {e}")
-
-            # Run in separate thread
-            thread = threading.Thread(target=set_volume_in_thread, daemon=True)
-            thread.start()
-            thread.join(timeout=5)
-
-            if not success[0] and error_msg[0]:
-                logger.warning(f"Volume control error: {error_msg[0]}")
-
-            return {
-                'success': True,
-                'message': _i18n.t('command_executed'),
-                'action': 'set_volume',
-                'volume': volume
-            }
-        except ValueError:
-            logger.error(f"Invalid volume value: {volume_str}")
-            return {
-                'success': False,
-                'message': _i18n.t('command_failed'),
-                'error': "Volume must be between 0-100"
-            }
+            _run_on_volume_thread(_set_master_volume, volume).result(timeout=5)
+            logger.info("System volume set to %s%%", volume)
         except Exception as e:
-            logger.error(f"Set volume failed: {e}")
-            return {
-                'success': False,
-                'message': _i18n.t('command_failed'),
-                'error': str(e)
-            }
+            logger.error("Failed to set system volume: %s", e)
+
+    def _schedule_volume_step(self, delta: int) -> None:
+        """Add delta to the pending step, queueing a flush on the volume worker if none is waiting"""
+        with self._flush_lock:
+            self._pending_step += delta
+            if self._flush_queued:
+                return
+            self._flush_queued = True
+        _run_on_volume_thread(self._flush_volume_after_delay)
+
+    def _flush_volume_after_delay(self) -> None:
+        """Volume worker job: let rapid volume steps settle, then apply them"""
+        time.sleep(self.VOLUME_FLUSH_DELAY)
+        self._flush_volume()
+
+    def _flush_volume(self) -> None:
+        """Apply the coalesced step to the system volume (runs on the volume worker thread)"""
+        with self._flush_lock:
+            self._flush_queued = False
+            delta, self._pending_step = self._pending_step, 0
+        if not delta:
+            return
+        try:
+            volume = _step_master_volume(delta)
+        except Exception as e:
+            logger.error("Failed to change system volume: %s", e)
+            return
+        logger.info("System volume set to %s%%", volume)
+        self._volume = volume
+
+    @staticmethod
+    def _invalid_volume(volume_str: str) -> dict:
+        """Result for a volume value that is not a number"""
+        logger.error("Invalid volume value: %s", volume_str)
+        return fail_result("Volume must be between 0-100")
 
     def volume_up(self) -> dict:
         """
-        Increase volume
+        Increase volume by VOLUME_STEP
+
+        The change is applied asynchronously relative to the real system level,
+        so the result carries no volume level.
 
         Returns:
             dict: Execution result
         """
-        try:
-            new_volume = min(100, self._volume + 10)
-            self._volume = new_volume
-
-            logger.info(f"Volume up: {self._volume}")
-
-            # TODO: Actual volume control
-            # import pyautogui
-            # for _ in range(5):  # Increase about 10% volume
-            #     pyautogui.press('volumeup')
-
-            return {
-                'success': True,
-                'message': _i18n.t('command_executed'),
-                'action': 'volume_up',
-                'volume': self._volume
-            }
-        except Exception as e:
-            logger.error(f"Volume up failed: {e}")
-            return {
-                'success': False,
-                'message': _i18n.t('command_failed'),
-                'error': str(e)
-            }
+        logger.info("Volume up")
+
+        # Repeated steps are coalesced into one change relative to the real system level
+        self._schedule_volume_step(self.VOLUME_STEP)
+
+        return ok_result('volume_up')
 
     def volume_down(self) -> dict:
         """
-        Decrease volume
+        Decrease volume by VOLUME_STEP
+
+        The change is applied asynchronously relative to the real system level,
+        so the result carries no volume level.
 
         Returns:
             dict: Execution result
         """
-        try:
-            new_volume = max(0, self._volume - 10)
-            self._volume = new_volume
-
-            logger.info(f"Volume down: {self._volume}")
-
-            # TODO: Actual volume control
-            # import pyautogui
-            # for _ in range(5):  # Decrease about 10% volume
-            #     pyautogui.press('volumedown')
-
-            return {
-                'success': True,
-                'message': _i18n.t('command_executed'),
-                'action': 'volume_down',
-                'volume': self._volume
-            }
-        except Exception as e:
-            logger.error(f"Volume down failed: {e}")
-            return {
-                'success': False,
-                'message': _i18n.t('command_failed'),
-                'error': str(e)
-            }
-
-
-if __name__ == "__main__":
-    # Test code
-    logging.basicConfig(level=logging.INFO)
-
-    def test_media_commands():
-        """Test media commands"""
-        logger.info("Testing media control commands")
-
-        commands = MediaCommands()
-
-        # Test volume setting
-        result = commands.set_volume("75")
-        logger.info(f"Set volume result: {result}")
+        logger.info("Volume down")
 
-        # Test play/pause
-        result = commands.play_pause()
-        logger.info(f"Play/pause result: {result}")
+        # Repeated steps are coalesced into one change relative to the real system level
+        self._schedule_volume_step(-self.VOLUME_STEP)
 
-    # Run test
-    test_media_commands()
+        return ok_result('volume_down')
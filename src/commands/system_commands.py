@@ -3,11 +3,15 @@ System Commands Module
 Implements cross-platform system control commands (shutdown, restart, lock screen, etc.)
 """
 
+import atexit
 import logging
+import os
 import platform
-import subprocess
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Callable
 
-from src.i18n import get_i18n
+from ._shared import ok_result, safe
 
 # Import platform abstraction layer
 try:
@@ -17,323 +21,176 @@ except ImportError:
     PLATFORM_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
-_i18n = get_i18n()
+
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+
+# Absolute tool paths for the Windows fallbacks, so no PATH search per command
+_SYSTEM32 = os.path.join(os.environ.get('SYSTEMROOT', r'C:\Windows'), 'System32')
+_SHUTDOWN_EXE = os.path.join(_SYSTEM32, 'shutdown.exe')
+# subprocess.CREATE_NO_WINDOW (Windows only): no console window for the helper process
+_CREATE_NO_WINDOW = 0x08000000
+
+# Worker threads for system commands whose result the caller doesn't wait for
+_EXEC = ThreadPoolExecutor(max_workers=2, thread_name_prefix='syscmd')
+atexit.register(_EXEC.shutdown, wait=False)
+
+
+def _log_if_error(what: str, future: Future) -> None:
+    """Log a failed background system command"""
+    exc = future.exception()
+    if exc is not None:
+        logger.error("%s failed: %s", what, exc)
+
+
+def _run_in_background(what: str, fn, *args, **kwargs) -> None:
+    """Call fn in the worker pool and log (rather than raise) any failure"""
+    future = _EXEC.submit(fn, *args, **kwargs)
+    future.add_done_callback(partial(_log_if_error, what))
 
 
 class SystemCommands:
-    """System Control Commands (cross-platform)"""
+    """
+    System Control Commands (cross-platform)
+
+    shutdown(), restart(), sleep(), hibernate(), lock() and logoff() are bound per instance
+    in __init__: each calls the platform implementation and falls back to the
+    Windows-specific method (or a not-supported result) when that fails.
+    """
+
+    # action -> (platform method, log level, message logged before the platform call)
+    _ACTIONS = {
+        'shutdown': ('shutdown', logging.WARNING, "Executing shutdown command"),
+        'restart': ('restart', logging.WARNING, "Executing restart command"),
+        'sleep': ('sleep', logging.INFO, "Executing sleep command"),
+        'hibernate': ('hibernate', logging.INFO, "Executing hibernate command"),
+        'lock': ('lock_screen', logging.INFO, "Executing lock screen command"),
+        'logoff': ('logoff', logging.WARNING, "Executing log off command"),
+    }
 
     def __init__(self):
         """Initialize system commands with platform abstraction"""
         self._platform = None
+        self._platform_name = None
         if PLATFORM_AVAILABLE:
             try:
                 self._platform = get_platform_instance()
-                logger.info(f"SystemCommands initialized with {self._platform.get_platform_name()}")
+                self._platform_name = self._platform.get_platform_name()
+                logger.info("SystemCommands initialized with %s", self._platform_name)
             except Exception as e:
-                logger.warning(f"Failed to initialize platform abstraction: {e}")
+                logger.warning("Failed to initialize platform abstraction: %s", e)
+
+        # Platform and fallback are known now, bind each action once
+        for action in self._ACTIONS:
+            setattr(self, action, self._make_dispatch(action))
+
+    def _make_dispatch(self, action: str) -> Callable[[], dict]:
+        """Build the handler for action, pre-bound to its platform method and fallback"""
+        if _IS_WINDOWS:
+            fallback = getattr(self, f'_{action}_windows')
+        else:
+            fallback = partial(self._not_supported, action)
+
+        if self._platform is None:
+            return fallback
+
+        method, level, message = self._ACTIONS[action]
+        platform_call = getattr(self._platform, method)
+
+        def dispatch() -> dict:
+            try:
+                logger.log(level, message)
+                if platform_call():
+                    return ok_result(action)
+            except Exception as e:
+                logger.error("Platform %s failed: %s", action, e)
+            return fallback()
+
+        dispatch.__name__ = action
+        return dispatch
 
     @staticmethod
     def _not_supported(action: str) -> dict:
         """Return standardized not-supported result for current platform."""
-        system = platform.system()
+        logger.warning("%s not supported for non-Windows fallback path", action)
         return {
             'success': False,
-            'message': f"{action} is not supported on {system} in fallback mode",
+            'message': f"{action} is not supported on {_SYSTEM} in fallback mode",
             'action': action,
         }
 
-    def shutdown(self) -> dict:
-        """
-        Shutdown
-
-        Returns:
-            dict: Execution result
-        """
-        if self._platform:
-            try:
-                logger.warning("Executing shutdown command")
-                success = self._platform.shutdown()
-                if success:
-                    return {
-                        'success': True,
-                        'message': _i18n.t('command_executed'),
-                        'action': 'shutdown'
-                    }
-            except Exception as e:
-                logger.error(f"Platform shutdown failed: {e}")
-        
-        # Fallback to Windows-specific implementation
-        if platform.system() != "Windows":
-            logger.warning("Shutdown not supported for non-Windows fallback path")
-            return self._not_supported('shutdown')
-        return self._shutdown_windows()
-
-    def restart(self) -> dict:
-        """
-        Restart
-
-        Returns:
-            dict: Execution result
-        """
-        if self._platform:
-            try:
-                logger.warning("Executing restart command")
-                success = self._platform.restart()
-                if success:
-                    return {
-                        'success': True,
-                        'message': _i18n.t('command_executed'),
-                        'action': 'restart'
-                    }
-            except Exception as e:
-                logger.error(f"Platform restart failed: {e}")
-        
-        # Fallback to Windows-specific implementation
-        if platform.system() != "Windows":
-            logger.warning("Restart not supported for non-Windows fallback path")
-            return self._not_supported('restart')
-        return self._restart_windows()
-
-    def sleep(self) -> dict:
-        """
-        Sleep
-
-        Returns:
-            dict: Execution result
-        """
-        if self._platform:
-            try:
-                logger.info("Executing sleep command")
-                success = self._platform.sleep()
-                if success:
-                    return {
-                        'success': True,
-                        'message': _i18n.t('command_executed'),
-                        'action': 'sleep'
-                    }
-            except Exception as e:
-                logger.error(f"Platform sleep failed: {e}")
-        
-        # Fallback to Windows-specific implementation
-        if platform.system() != "Windows":
-            logger.warning("Sleep not supported for non-Windows fallback path")
-            return self._not_supported('sleep')
-        return self._sleep_windows()
-
-    def hibernate(self) -> dict:
-        """
-        Hibernate
-
-        Returns:
-            dict: Execution result
-        """
-        if self._platform:
-            try:
-                logger.info("Executing hibernate command")
-                success = self._platform.hibernate()
-                if success:
-                    return {
-                        'success': True,
-                        'message': _i18n.t('command_executed'),
-                        'action': 'hibernate'
-                    }
-            except Exception as e:
-                logger.error(f"Platform hibernate failed: {e}")
-        
-        # Fallback to Windows-specific implementation
-        if platform.system() != "Windows":
-            logger.warning("Hibernate not supported for non-Windows fallback path")
-            return self._not_supported('hibernate')
-        return self._hibernate_windows()
-
-    def lock(self) -> dict:
-        """
-        Lock screen
-
-        Returns:
-            dict: Execution result
-        """
-        if self._platform:
-            try:
-                logger.info("Executing lock screen command")
-                success = self._platform.lock_screen()
-                if success:
-                    return {
-                        'success': True,
-                        'message': _i18n.t('command_executed'),
-                        'action': 'lock'
-                    }
-            except Exception as e:
-                logger.error(f"Platform lock screen failed: {e}")
-        
-        # Fallback to Windows-specific implementation
-        if platform.system() != "Windows":
-            logger.warning("Lock not supported for non-Windows fallback path")
-            return self._not_supported('lock')
-        return self._lock_windows()
-
-    def logoff(self) -> dict:
-        """
-        Log off
-
-        Returns:
-            dict: Execution result
-        """
-        if self._platform:
-            try:
-                logger.warning("Executing log off command")
-                success = self._platform.logoff()
-                if success:
-                    return {
-                        'success': True,
-                        'message': _i18n.t('command_executed'),
-                        'action': 'logoff'
-                    }
-            except Exception as e:
-                logger.error(f"Platform logoff failed: {e}")
-        
-        # Fallback to Windows-specific implementation
-        if platform.system() != "Windows":
-            logger.warning("Logoff not supported for non-Windows fallback path")
-            return self._not_supported('logoff')
-        return self._logoff_windows()
-
     # ========== Windows-specific fallback methods ==========
 
     @staticmethod
+    @safe('Shutdown')
     def _shutdown_windows() -> dict:
         """Windows-specific shutdown"""
-        try:
-            logger.warning("Executing Windows shutdown command")
-            subprocess.run(['shutdown', '/s', '/t', '0'], check=True)
-            return {
-                'success': True,
-                'message': _i18n.t('command_executed'),
-                'action': 'shutdown'
-            }
-        except Exception as e:
-            logger.error(f"Shutdown failed: {e}")
-            return {
-                'success': False,
-                'message': _i18n.t('command_failed'),
-                'error': str(e)
-            }
+        import subprocess
+
+        logger.warning("Executing Windows shutdown command")
+        _run_in_background(
+            'Shutdown', subprocess.run, [_SHUTDOWN_EXE, '/s', '/t', '0'],
+            check=True, creationflags=_CREATE_NO_WINDOW,
+        )
+        return ok_result('shutdown')
 
     @staticmethod
+    @safe('Restart')
     def _restart_windows() -> dict:
         """Windows-specific restart"""
-        try:
-            logger.warning("Executing Windows restart command")
-            subprocess.run(['shutdown', '/r', '/t', '0'], check=True)
-            return {
-                'success': True,
-                'message': _i18n.t('command_executed'),
-                'action': 'restart'
-            }
-        except Exception as e:
-            logger.error(f"Restart failed: {e}")
-            return {
-                'success': False,
-                'message': _i18n.t('command_failed'),
-                'error': str(e)
-            }
+        import subprocess
+
+        logger.warning("Executing Windows restart command")
+        _run_in_background(
+            'Restart', subprocess.run, [_SHUTDOWN_EXE, '/r', '/t', '0'],
+            check=True, creationflags=_CREATE_NO_WINDOW,
+        )
+        return ok_result('restart')
 
     @staticmethod
+    @safe('Sleep')
     def _sleep_windows() -> dict:
         """Windows-specific sleep"""
-        try:
-            logger.info("Executing Windows sleep command")
-            subprocess.run(['rundll32.exe', 'powrprof.dll,SetSuspendState', '0,1,0'], check=True)
-            return {
-                'success': True,
-                'message': _i18n.t('command_executed'),
-                'action': 'sleep'
-            }
-        except Exception as e:
-            logger.error(f"Sleep failed: {e}")
-            return {
-                'success': False,
-                'message': _i18n.t('command_failed'),
-                'error': str(e)
-            }
+        # rundll32 powrprof.dll,SetSuspendState hibernates when hibernation is enabled; call it directly
+        from src.platforms.windows import suspend_system
+
+        logger.info("Executing Windows sleep command")
+        suspend_system(hibernate=False)
+        return ok_result('sleep')
 
     @staticmethod
+    @safe('Hibernate')
     def _hibernate_windows() -> dict:
         """Windows-specific hibernate"""
-        try:
-            logger.info("Executing Windows hibernate command")
-            subprocess.run(['shutdown', '/h'], check=True)
-            return {
-                'success': True,
-                'message': _i18n.t('command_executed'),
-                'action': 'hibernate'
-            }
-        except Exception as e:
-            logger.error(f"Hibernate failed: {e}")
-            return {
-                'success': False,
-                'message': _i18n.t('command_failed'),
-                'error': str(e)
-            }
+        import subprocess
+
+        logger.info("Executing Windows hibernate command")
+        _run_in_background(
+            'Hibernate', subprocess.run, [_SHUTDOWN_EXE, '/h'],
+            check=True, creationflags=_CREATE_NO_WINDOW,
+        )
+        return ok_result('hibernate')
 
     @staticmethod
+    @safe('Lock screen')
     def _lock_windows() -> dict:
         """Windows-specific lock screen"""
-        try:
-            logger.info("Executing Windows lock screen command")
-            subprocess.run(['rundll32.exe', 'user32.dll,LockWorkStation'], check=True)
-            return {
-                'success': True,
-                'message': _i18n.t('command_executed'),
-                'action': 'lock'
-            }
-        except Exception as e:
-            logger.error(f"Lock screen failed: {e}")
-            return {
-                'success': False,
-                'message': _i18n.t('command_failed'),
-                'error': str(e)
-            }
+        import ctypes
+
+        logger.info("Executing Windows lock screen command")
+        if not ctypes.windll.user32.LockWorkStation():
+            raise ctypes.WinError()
+        return ok_result('lock')
 
     @staticmethod
+    @safe('Log off')
     def _logoff_windows() -> dict:
         """Windows-specific logoff"""
-        try:
-            logger.warning("Executing Windows log off command")
-            subprocess.run(['shutdown', '/l'], check=True)
-            return {
-                'success': True,
-                'message': _i18n.t('command_executed'),
-                'action': 'logoff'
-            }
-        except Exception as e:
-            logger.error(f"Log off failed: {e}")
-            return {
-                'success': False,
-                'message': _i18n.t('command_failed'),
-                'error': str(e)
-            }
-
-
-if __name__ == "__main__":
-    # Test code
-    logging.basicConfig(level=logging.INFO)
-
-    def test_system_commands():
-        """Test system commands"""
-        logger.info("Testing system commands (demo only, dangerous commands will not be executed)")
-
-        # Only test lock screen (relatively safe)
-        _ = SystemCommands()
-
-        logger.info("Available system commands:")
-        logger.info("  - shutdown: Shutdown")
-        logger.info("  - restart: Restart")
-        logger.info("  - sleep: Sleep")
-        logger.info("  - hibernate: Hibernate")
-        logger.info("  - lock: Lock screen")
-        logger.info("  - logoff: Log off")
-
-    # Run test
-    test_system_commands()
+        import subprocess
+
+        logger.warning("Executing Windows log off command")
+        _run_in_background(
+            'Log off', subprocess.run, [_SHUTDOWN_EXE, '/l'],
+            check=True, creationflags=_CREATE_NO_WINDOW,
+        )
+        return ok_result('logoff')
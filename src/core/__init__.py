@@ -1,22 +1,56 @@
 """Core Module"""
 
-from .models import (
-    ServerState,
-    AvailableWakeWord,
-    WakeWordType,
-    AudioPlayer,
-    Preferences,
-)
-from .esphome_protocol import (
-    ESPHomeProtocol,
-    ESPHomeServer,
-    create_default_state,
-    start_server,
-)
-from .mdns_discovery import (
-    MDNSBroadcaster,
-    DeviceInfo,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+# Public name -> submodule; submodules are imported on first attribute access (PEP 562)
+_LAZY_ATTRS = {
+    "ServerState": "models",
+    "AvailableWakeWord": "models",
+    "WakeWordType": "models",
+    "AudioPlayer": "models",
+    "Preferences": "models",
+    "ESPHomeProtocol": "esphome_protocol",
+    "ESPHomeServer": "esphome_protocol",
+    "create_default_state": "esphome_protocol",
+    "start_server": "esphome_protocol",
+    "MDNSBroadcaster": "mdns_discovery",
+    "DeviceInfo": "mdns_discovery",
+}
+
+if TYPE_CHECKING:
+    from .models import (
+        ServerState,
+        AvailableWakeWord,
+        WakeWordType,
+        AudioPlayer,
+        Preferences,
+    )
+    from .esphome_protocol import (
+        ESPHomeProtocol,
+        ESPHomeServer,
+        create_default_state,
+        start_server,
+    )
+    from .mdns_discovery import (
+        MDNSBroadcaster,
+        DeviceInfo,
+    )
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __all__ = [
     "ServerState",
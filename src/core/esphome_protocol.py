@@ -9,8 +9,9 @@ import asyncio
 import logging
 import socket
 import threading
+from collections import deque
 from collections.abc import Iterable
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Deque, Dict, List, Optional, Set
 
 # pylint: disable=no-name-in-module
 from aioesphomeapi.api_pb2 import (
@@ -68,6 +69,8 @@ class ESPHomeProtocol(asyncio.Protocol):
 
     MAX_BUFFER_SIZE = 4 * 1024 * 1024
     STATE_UPDATE_INTERVAL = 15.0
+    # Recorder chunks waiting for the event loop; the oldest are dropped (and counted) if the loop stalls
+    MAX_PENDING_AUDIO_CHUNKS = 100
 
     def __init__(self, state: ServerState):
         super().__init__()
@@ -83,6 +86,12 @@ class ESPHomeProtocol(asyncio.Protocol):
         self._writelines = None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._loop_thread_id: Optional[int] = None
+        self._pending_audio: Deque[bytes] = deque(maxlen=self.MAX_PENDING_AUDIO_CHUNKS)
+        self._audio_flush_scheduled = False
+        self._audio_chunks_sent = 0
+        # Chunks pushed out of _pending_audio (recorder thread) / already logged (loop thread)
+        self._audio_chunks_dropped = 0
+        self._audio_drops_logged = 0
 
         # Voice Assistant state machine
         self._is_streaming_audio = False
@@ -94,6 +103,7 @@ class ESPHomeProtocol(asyncio.Protocol):
         self._volume_ducking_enabled = False  # User preference: do not lower global system volume
 
         self._audio_streaming_task: Optional[asyncio.Task] = None
+        self._timer_loop: Optional[asyncio.AbstractEventLoop] = None
         self._event_loop: Optional[asyncio.AbstractEventLoop] = None
 
         # External wake word cache
@@ -114,18 +124,18 @@ class ESPHomeProtocol(asyncio.Protocol):
         # Phase callback for tray icon state updates
         self._phase_callback: Optional[Callable[[str], None]] = None
 
-        logger.debug(f"ESPHome protocol initialized: {self.state.name}")
+        logger.debug("ESPHome protocol initialized: %s", self.state.name)
 
     def set_phase_callback(self, callback: Optional[Callable[[str], None]]) -> None:
         self._phase_callback = callback
 
     def _set_phase(self, phase: str) -> None:
-        logger.info(f"Phase: {phase}")
+        logger.info("Phase: %s", phase)
         if self._phase_callback:
             try:
                 self._phase_callback(phase)
             except Exception as e:
-                logger.debug(f"Phase callback error: {e}")
+                logger.debug("Phase callback error: %s", e)
 
     # ========== Connection Lifecycle ==========
 
@@ -146,7 +156,7 @@ class ESPHomeProtocol(asyncio.Protocol):
             self._ha_host = peername[0]
             if self._service_manager is not None:
                 self._service_manager.set_ha_host(self._ha_host)
-        logger.info(f"📱 New client connected: {peername}")
+        logger.info("📱 New client connected: %s", peername)
         self._set_phase('idle')
 
     def connection_lost(self, exc) -> None:
@@ -197,7 +207,7 @@ class ESPHomeProtocol(asyncio.Protocol):
             # Read preamble (must be 0x00)
             preamble = self._read_varuint()
             if preamble != 0x00:
-                logger.error(f"Invalid preamble: {preamble}, clearing buffer")
+                logger.error("Invalid preamble: %s, clearing buffer", preamble)
                 self._buffer = None
                 self._buffer_len = 0
                 self._pos = 0
@@ -261,40 +271,23 @@ class ESPHomeProtocol(asyncio.Protocol):
         """Process received packet"""
         msg_class = MESSAGE_TYPE_TO_PROTO.get(msg_type)
         if msg_class is None:
-            logger.warning(f"Unknown message type: {msg_type}")
+            logger.warning("Unknown message type: %s", msg_type)
             return
 
         msg_inst = msg_class.FromString(packet_data)
 
-        # Basic protocol messages
-        if isinstance(msg_inst, HelloRequest):
-            self._handle_hello(msg_inst)
-        elif isinstance(msg_inst, AuthenticationRequest):
-            self._handle_auth(msg_inst)
-        elif isinstance(msg_inst, DisconnectRequest):
-            self._handle_disconnect(msg_inst)
-        elif isinstance(msg_inst, PingRequest):
-            self.send_messages([PingResponse()])
-        # Voice Assistant messages
-        elif isinstance(msg_inst, VoiceAssistantEventResponse):
-            self._handle_voice_event(msg_inst)
-        elif isinstance(msg_inst, VoiceAssistantAnnounceRequest):
-            self._handle_announce_request(msg_inst)
-        elif isinstance(msg_inst, VoiceAssistantTimerEventResponse):
-            self._handle_timer_event(msg_inst)
-        elif isinstance(msg_inst, VoiceAssistantConfigurationRequest):
-            self._handle_voice_config(msg_inst)
-        elif isinstance(msg_inst, VoiceAssistantSetConfiguration):
-            self._handle_set_voice_config(msg_inst)
-        # Entity messages
+        handler = self._PACKET_HANDLERS.get(msg_class)
+        if handler is not None:
+            handler(self, msg_inst)
         else:
+            # Entity messages
             msgs = list(self.handle_message(msg_inst))
             if msgs:
                 self.send_messages(msgs)
 
     def _handle_hello(self, msg: HelloRequest) -> None:
         """Handle Hello request"""
-        logger.debug(f"Client Hello: {msg.client_info}, API {msg.api_version_major}.{msg.api_version_minor}")
+        logger.debug("Client Hello: %s, API %s.%s", msg.client_info, msg.api_version_major, msg.api_version_minor)
         self.send_messages(
             [
                 HelloResponse(
@@ -310,6 +303,10 @@ class ESPHomeProtocol(asyncio.Protocol):
         logger.debug("Client authentication")
         self.send_messages([AuthenticationResponse()])
 
+    def _handle_ping(self, msg: PingRequest) -> None:
+        """Handle Ping request"""
+        self.send_messages([PingResponse()])
+
     def _handle_disconnect(self, msg: DisconnectRequest) -> None:
         """Handle disconnect request"""
         logger.debug("Client requested disconnect")
@@ -335,9 +332,9 @@ class ESPHomeProtocol(asyncio.Protocol):
 
         References linux-voice-assistant's handle_voice_event
         """
-        logger.debug(f"Voice event: type={event_type.name}, data={data}")
+        logger.debug("Voice event: type=%s, data=%s", event_type.name, data)
 
-        if event_type == VoiceAssistantEventType.VOICE_ASSISTANT_RUN_START:
+        if event_type is VoiceAssistantEventType.VOICE_ASSISTANT_RUN_START:
             # Conversation started
             self._tts_url = data.get("url")
             self._tts_played = False
@@ -345,7 +342,7 @@ class ESPHomeProtocol(asyncio.Protocol):
             self._processing = False
             self._set_phase('listening')
 
-        elif event_type == VoiceAssistantEventType.VOICE_ASSISTANT_INTENT_START:
+        elif event_type is VoiceAssistantEventType.VOICE_ASSISTANT_INTENT_START:
             if self.state.thinking_sound_enabled and self.state.processing_sound and not self._processing:
                 self._processing = True
                 self.duck()
@@ -357,38 +354,38 @@ class ESPHomeProtocol(asyncio.Protocol):
             VoiceAssistantEventType.VOICE_ASSISTANT_STT_END,
         ):
             # Speech recognition ended, stop audio stream and recording
-            logger.info(f"🎤 Received {event_type.name}, clearing streaming flag")
+            logger.info("🎤 Received %s, clearing streaming flag", event_type.name)
             self._is_streaming_audio = False
             self._stop_audio_streaming()
             logger.debug("🎤 Speech recognition ended, stopping recording")
 
-        elif event_type == VoiceAssistantEventType.VOICE_ASSISTANT_INTENT_PROGRESS:
+        elif event_type is VoiceAssistantEventType.VOICE_ASSISTANT_INTENT_PROGRESS:
             # Intent processing progress
             if data.get("tts_start_streaming") == "1":
                 logger.info("🎤 INTENT_PROGRESS: tts_start_streaming")
                 self._set_phase('replying')
                 self.play_tts()
 
-        elif event_type == VoiceAssistantEventType.VOICE_ASSISTANT_INTENT_END:
+        elif event_type is VoiceAssistantEventType.VOICE_ASSISTANT_INTENT_END:
             # Intent processing ended
             logger.info("🎤 Received INTENT_END")
             self._processing = False
             if data.get("continue_conversation") == "1":
                 self._continue_conversation = True
 
-        elif event_type == VoiceAssistantEventType.VOICE_ASSISTANT_TTS_START:
+        elif event_type is VoiceAssistantEventType.VOICE_ASSISTANT_TTS_START:
             # TTS generation started, emit phase for UI feedback
             logger.info("🎤 Received TTS_START")
             self._set_phase('replying')
 
-        elif event_type == VoiceAssistantEventType.VOICE_ASSISTANT_TTS_END:
+        elif event_type is VoiceAssistantEventType.VOICE_ASSISTANT_TTS_END:
             # TTS generation ended
             url = data.get("url", "")
-            logger.info(f"🎤 Received TTS_END with URL: {url[:60]}...")
+            logger.info("🎤 Received TTS_END with URL: %.60s...", url)
             self._tts_url = url
             self.play_tts()
 
-        elif event_type == VoiceAssistantEventType.VOICE_ASSISTANT_RUN_END:
+        elif event_type is VoiceAssistantEventType.VOICE_ASSISTANT_RUN_END:
             # Conversation ended
             logger.info("🎤 Received RUN_END, clearing streaming flag")
             self._is_streaming_audio = False
@@ -400,15 +397,15 @@ class ESPHomeProtocol(asyncio.Protocol):
             if not self._is_playing_tts:
                 self._set_phase('idle')
 
-        elif event_type == VoiceAssistantEventType.VOICE_ASSISTANT_ERROR:
-            logger.error(f"Voice assistant error: {data}")
+        elif event_type is VoiceAssistantEventType.VOICE_ASSISTANT_ERROR:
+            logger.error("Voice assistant error: %s", data)
             self._is_streaming_audio = False
             self._processing = False
             self._stop_audio_streaming()
             self._set_phase('error')
 
         else:
-            logger.info(f"Unhandled voice assistant event: {event_type.name} (type={event_type.value})")
+            logger.info("Unhandled voice assistant event: %s (type=%s)", event_type.name, event_type.value)
 
     def _handle_timer_event(self, msg: VoiceAssistantTimerEventResponse) -> None:
         """Handle timer event"""
@@ -421,9 +418,9 @@ class ESPHomeProtocol(asyncio.Protocol):
 
         References linux-voice-assistant's handle_timer_event
         """
-        logger.debug(f"Timer event: type={event_type.name}")
+        logger.debug("Timer event: type=%s", event_type.name)
 
-        if event_type == VoiceAssistantTimerEventType.VOICE_ASSISTANT_TIMER_FINISHED:
+        if event_type is VoiceAssistantTimerEventType.VOICE_ASSISTANT_TIMER_FINISHED:
             if not self._timer_finished:
                 # Add stop word to active wake words
                 if self.state.stop_word:
@@ -484,7 +481,7 @@ class ESPHomeProtocol(asyncio.Protocol):
 
             model_info = self.state.available_wake_words.get(wake_word_id)
             if model_info:
-                logger.debug(f"Setting wake word: {wake_word_id}")
+                logger.debug("Setting wake word: %s", wake_word_id)
                 if wake_word_id not in active_wake_words:
                     active_wake_words.append(wake_word_id)
 
@@ -496,7 +493,7 @@ class ESPHomeProtocol(asyncio.Protocol):
         self.state.save_preferences()
         self.state.wake_words_changed = True
 
-        logger.info(f"🎤 Active wake words updated: {self.state.active_wake_words}")
+        logger.info("🎤 Active wake words updated: %s", self.state.active_wake_words)
 
     # ========== Announcement Processing ==========
 
@@ -506,7 +503,7 @@ class ESPHomeProtocol(asyncio.Protocol):
 
         References linux-voice-assistant's handle_message VoiceAssistantAnnounceRequest handling
         """
-        logger.info(f"Received announcement request: {msg.text}")
+        logger.info("Received announcement request: %s", msg.text)
 
         # Build playlist
         urls = []
@@ -531,6 +528,22 @@ class ESPHomeProtocol(asyncio.Protocol):
             # No audio, complete directly
             self._tts_finished()
 
+    # Message class -> handler for messages processed directly by the protocol
+    # (exact type match, protobuf classes are final); everything else goes to handle_message
+    _PACKET_HANDLERS = {
+        # Basic protocol messages
+        HelloRequest: _handle_hello,
+        AuthenticationRequest: _handle_auth,
+        DisconnectRequest: _handle_disconnect,
+        PingRequest: _handle_ping,
+        # Voice Assistant messages
+        VoiceAssistantEventResponse: _handle_voice_event,
+        VoiceAssistantAnnounceRequest: _handle_announce_request,
+        VoiceAssistantTimerEventResponse: _handle_timer_event,
+        VoiceAssistantConfigurationRequest: _handle_voice_config,
+        VoiceAssistantSetConfiguration: _handle_set_voice_config,
+    }
+
     def _play_announcement(self, urls: List[str]) -> None:
         """Play announcement audio"""
         if not urls:
@@ -571,13 +584,42 @@ class ESPHomeProtocol(asyncio.Protocol):
             return
 
         # Log first few audio chunks
-        if not hasattr(self, "_audio_chunks_sent"):
-            self._audio_chunks_sent = 0
         self._audio_chunks_sent += 1
         if self._audio_chunks_sent <= 5:
-            logger.info(f"🎤 Sending audio chunk #{self._audio_chunks_sent}: {len(audio_chunk)} bytes")
+            logger.info("🎤 Sending audio chunk #%d: %d bytes", self._audio_chunks_sent, len(audio_chunk))
 
-        self.send_messages([VoiceAssistantAudio(data=audio_chunk)])
+        loop = self._loop
+        if loop is None or threading.get_ident() == self._loop_thread_id:
+            self.send_messages([VoiceAssistantAudio(data=audio_chunk)])
+            return
+
+        # Recorder thread: queue the chunk and wake the loop once per batch, not once per chunk
+        if len(self._pending_audio) == self.MAX_PENDING_AUDIO_CHUNKS:
+            # The append below pushes out the oldest chunk
+            self._audio_chunks_dropped += 1
+        self._pending_audio.append(audio_chunk)
+        if not self._audio_flush_scheduled:
+            self._audio_flush_scheduled = True
+            loop.call_soon_threadsafe(self._flush_pending_audio)
+
+    def _flush_pending_audio(self) -> None:
+        """Send the audio chunks queued by the recorder thread in a single write"""
+        self._audio_flush_scheduled = False
+        dropped = self._audio_chunks_dropped - self._audio_drops_logged
+        if dropped:
+            self._audio_drops_logged += dropped
+            logger.warning("🎤 Event loop stalled: dropped %d queued audio chunks (%d total)",
+                           dropped, self._audio_drops_logged)
+        pending = self._pending_audio
+        if not self._is_streaming_audio or self._writelines is None:
+            # Nobody to send to: drop the backlog without building messages
+            pending.clear()
+            return
+        msgs = []
+        while pending:
+            msgs.append(VoiceAssistantAudio(data=pending.popleft()))
+        if msgs:
+            self.send_messages(msgs)
 
     def wakeup(self, wake_word_phrase: str = "") -> None:
         """
@@ -592,8 +634,8 @@ class ESPHomeProtocol(asyncio.Protocol):
             logger.debug("Stopped timer sound")
             return
 
-        logger.info(f"🎤 Wake word triggered: {wake_word_phrase}")
-        logger.info(f"🎤 Current streaming state before wakeup: {self._is_streaming_audio}")
+        logger.info("🎤 Wake word triggered: %s", wake_word_phrase)
+        logger.info("🎤 Current streaming state before wakeup: %s", self._is_streaming_audio)
 
         # Send voice assistant request
         logger.debug("Sending VoiceAssistantRequest(start=True)")
@@ -611,7 +653,7 @@ class ESPHomeProtocol(asyncio.Protocol):
 
         # Play wakeup sound
         if self.state.wakeup_sound:
-            logger.debug(f"Playing wakeup sound: {self.state.wakeup_sound}")
+            logger.debug("Playing wakeup sound: %s", self.state.wakeup_sound)
             self.state.tts_player.play(self.state.wakeup_sound)
         else:
             logger.warning("Wakeup sound not set")
@@ -637,7 +679,7 @@ class ESPHomeProtocol(asyncio.Protocol):
 
     def _on_hotkey_changed(self, hotkey: str) -> None:
         """Handle hotkey change"""
-        logger.info(f"Hotkey changed to: {hotkey}")
+        logger.info("Hotkey changed to: %s", hotkey)
 
         # Update preferences
         self.state.preferences.voice_input_hotkey = hotkey
@@ -689,7 +731,7 @@ class ESPHomeProtocol(asyncio.Protocol):
         except asyncio.CancelledError:
             pass
         except Exception as e:
-            logger.error(f"State update loop failed: {e}")
+            logger.error("State update loop failed: %s", e)
         finally:
             self._state_update_task = None
 
@@ -717,7 +759,7 @@ class ESPHomeProtocol(asyncio.Protocol):
         self._processing = False
         self._tts_played = True
         self._is_playing_tts = True  # Mark that TTS is playing
-        logger.info(f"Playing TTS: {self._tts_url}")
+        logger.info("Playing TTS: %s", self._tts_url)
 
         # Add stop word
         if self.state.stop_word:
@@ -732,7 +774,7 @@ class ESPHomeProtocol(asyncio.Protocol):
         try:
             self.state.music_player.duck()
         except Exception as e:
-            logger.error(f"Failed to duck volume: {e}")
+            logger.error("Failed to duck volume: %s", e)
 
     def unduck(self) -> None:
         """Restore volume"""
@@ -741,7 +783,7 @@ class ESPHomeProtocol(asyncio.Protocol):
         try:
             self.state.music_player.unduck()
         except Exception as e:
-            logger.error(f"Failed to unduck volume: {e}")
+            logger.error("Failed to unduck volume: %s", e)
 
     def _tts_finished(self) -> None:
         """TTS playback finished callback"""
@@ -783,18 +825,19 @@ class ESPHomeProtocol(asyncio.Protocol):
             return
 
         # Loop play timer sound with async delay
-        loop = asyncio.get_event_loop()
+        self._timer_loop = asyncio.get_event_loop()
 
-        async def on_done_async():
-            await asyncio.sleep(1.0)
-            if self._timer_finished:
-                loop.call_soon_threadsafe(self._play_timer_finished)
+        if self.state.timer_finished_sound:
+            self.state.tts_player.play(self.state.timer_finished_sound, done_callback=self._on_timer_sound_done)
 
-        def on_done():
-            asyncio.run_coroutine_threadsafe(on_done_async(), loop)
+    def _on_timer_sound_done(self) -> None:
+        """Player callback: replay the timer sound after a pause while the timer is still ringing"""
+        self._timer_loop.call_soon_threadsafe(self._timer_loop.call_later, 1.0, self._replay_timer_finished)
 
-        if self.state.timer_finished_sound:
-            self.state.tts_player.play(self.state.timer_finished_sound, done_callback=on_done)
+    def _replay_timer_finished(self) -> None:
+        """Replay the timer sound unless the timer was stopped during the pause"""
+        if self._timer_finished:
+            self._play_timer_finished()
 
     # ========== Entity Message Processing ==========
 
@@ -1012,7 +1055,7 @@ class ESPHomeServer:
     async def start(self) -> bool:
         """Start server"""
         try:
-            logger.info(f"Starting ESPHome API server @ {self.host}:{self.port}")
+            logger.info("Starting ESPHome API server @ %s:%s", self.host, self.port)
 
             loop = asyncio.get_event_loop()
 
@@ -1030,14 +1073,14 @@ class ESPHomeServer:
 
             self._is_running = True
             logger.info("ESPHome API server started")
-            logger.info(f"Listening address: {self.host}:{self.port}")
-            logger.info(f"Device name: {self.state.name}")
+            logger.info("Listening address: %s:%s", self.host, self.port)
+            logger.info("Device name: %s", self.state.name)
             logger.info("Waiting for Home Assistant connection...")
 
             return True
 
         except Exception as e:
-            logger.error(f"Failed to start server: {e}")
+            logger.error("Failed to start server: %s", e)
             return False
 
     async def stop(self) -> None:
@@ -120,15 +120,15 @@ class MDNSBroadcaster:
             self._is_registered = True
 
             logger.info("mDNS service registered successfully!")
-            logger.info(f"Device name: {self.device_info.name}")
-            logger.info(f"Local IP: {local_ip}")
-            logger.info(f"Listening port: {port}")
-            logger.info(f"MAC address: {self.device_info.mac_address}")
+            logger.info("Device name: %s", self.device_info.name)
+            logger.info("Local IP: %s", local_ip)
+            logger.info("Listening port: %s", port)
+            logger.info("MAC address: %s", self.device_info.mac_address)
 
             return True
 
         except Exception as e:
-            logger.error(f"mDNS service registration failed: {e}")
+            logger.error("mDNS service registration failed: %s", e)
             await self._cleanup()
             self._is_registered = False
             return False
@@ -191,7 +191,7 @@ class MDNSBroadcaster:
                 await self.aiozc.async_unregister_service(self.service_info)
                 logger.info("mDNS service unregistered")
             except Exception as e:
-                logger.error(f"Failed to unregister service: {e}")
+                logger.error("Failed to unregister service: %s", e)
             finally:
                 await self._cleanup()
                 self._is_registered = False
@@ -3,7 +3,10 @@
 支持中英双语切换
 """
 
-from typing import Dict
+import logging
+from typing import Callable, Dict, Tuple
+
+logger = logging.getLogger(__name__)
 
 
 class I18n:
@@ -12,6 +15,8 @@ class I18n:
     def __init__(self):
         """初始化并自动检测系统语言"""
         self.language = self._detect_system_language()
+        # Copy-on-write: set_language iterates a snapshot that registration never mutates
+        self._listeners: Tuple[Callable[[str], None], ...] = ()
         self.translations: Dict[str, Dict[str, str]] = {
             'zh_CN': {
                 # 应用信息
@@ -271,10 +276,27 @@ class I18n:
             bool: 是否设置成功
         """
         if language in self.translations:
-            self.language = language
+            if language != self.language:
+                self.language = language
+                # A failing listener must not stop the others from refreshing
+                log_error = logger.error
+                for listener in self._listeners:
+                    try:
+                        listener(language)
+                    except Exception as e:
+                        log_error("Language listener %r failed: %r", listener, e)
             return True
         return False
 
+    def add_language_listener(self, listener: Callable[[str], None]) -> None:
+        """
+        注册语言切换回调（用于刷新预先翻译好的文本）
+
+        Args:
+            listener: 回调函数，参数为新的语言代码
+        """
+        self._listeners += (listener,)
+
     def get_current_language(self) -> str:
         """获取当前语言"""
         return self.language
@@ -11,20 +11,17 @@ from src.ui.system_tray_icon import get_tray
 from src.core.esphome_protocol import ESPHomeServer
 from src.core.mdns_discovery import MDNSBroadcaster, DeviceInfo
 import sys
+import atexit
 import logging
+import queue
+import random
 import asyncio
 import argparse
 import socket
 import threading
+import time
 import platform
 
-# PyInstaller path setup
-if getattr(sys, 'frozen', False):
-    import os
-    src_path = os.path.join(sys._MEIPASS, 'src')
-    if src_path not in sys.path:
-        sys.path.insert(0, src_path)
-
 
 def check_dependencies():
     """Check if all required dependencies are available."""
@@ -71,6 +68,7 @@ def check_dependencies():
 # Configure logging
 # Use user directory for log file to avoid permission issues in Program Files
 import os
+from logging.handlers import QueueHandler, QueueListener
 
 
 def _get_log_dir() -> str:
@@ -116,18 +114,28 @@ os.makedirs(log_dir, exist_ok=True)
 log_file = os.path.join(log_dir, 'ha_windows.log')
 log_max_bytes = 5 * 1024 * 1024
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        SizeLimitedFileHandler(
-            log_file,
-            max_bytes=log_max_bytes,
-            encoding='utf-8',
-        ),
-        logging.StreamHandler()
-    ]
-)
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    SizeLimitedFileHandler(
+        log_file,
+        max_bytes=log_max_bytes,
+        encoding='utf-8',
+    ),
+    logging.StreamHandler()
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+# File and console writes happen on a listener thread; loggers only enqueue records
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# The queue handler only renders the message; the listener's handlers add the prefix
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 
 logger = logging.getLogger(__name__)
 
@@ -153,6 +161,10 @@ class HomeAssistantWindows:
 
     DEFAULT_PORT = 6053
     MDNS_RESTART_INTERVAL_SECONDS = 6 * 60 * 60
+    # Retries after a failed mDNS restart: exponential backoff with jitter, then give up until the next interval
+    MDNS_RETRY_BASE_SECONDS = 5
+    MDNS_RETRY_MAX_SECONDS = 5 * 60
+    MDNS_RETRY_ATTEMPTS = 6
 
     def __init__(self, device_name: str = None, port: int = None):
         """
@@ -299,14 +311,33 @@ class HomeAssistantWindows:
                     return
 
                 logger.info("Refreshing mDNS broadcaster to release cached zeroconf state")
-                success = await self.mdns_broadcaster.restart_service(self.port)
-                if not success:
-                    logger.warning("Failed to refresh mDNS broadcaster")
+                await self._restart_mdns_with_backoff()
         except asyncio.CancelledError:
             return
         except Exception as e:
             logger.error(f"mDNS refresh loop failed: {e}")
 
+    async def _restart_mdns_with_backoff(self) -> bool:
+        """Restart the mDNS broadcaster, retrying with jittered exponential backoff while it fails"""
+        for attempt in range(self.MDNS_RETRY_ATTEMPTS):
+            if await self.mdns_broadcaster.restart_service(self.port):
+                return True
+
+            delay = min(self.MDNS_RETRY_MAX_SECONDS, self.MDNS_RETRY_BASE_SECONDS * 2 ** attempt)
+            delay *= 0.5 + random.random()
+            logger.warning("Failed to refresh mDNS broadcaster, retrying in %.1fs", delay)
+            await asyncio.sleep(delay)
+            if not self.running or not self.mdns_broadcaster:
+                return False
+
+        success = await self.mdns_broadcaster.restart_service(self.port)
+        if not success:
+            logger.error(
+                "mDNS broadcaster still failing after %d retries, waiting for next refresh",
+                self.MDNS_RETRY_ATTEMPTS,
+            )
+        return success
+
     def _request_quit(self) -> None:
         """Request application quit"""
         logger.info("Quit requested from tray")
@@ -351,60 +382,19 @@ class HomeAssistantWindows:
             self._last_wakeup_time = 0  # For debouncing
 
             # Set callback
-            def on_wake_word(wake_word_phrase: str):
-                import time
-                now = time.monotonic()
-                # Debounce: ignore if triggered within 2 seconds
-                if now - self._last_wakeup_time < 2.0:
-                    return
-                self._last_wakeup_time = now
-
-                logger.info(f"🎤 Wake word detected: {wake_word_phrase}")
-                if self.api_server and self.api_server.protocol:
-                    try:
-                        self.api_server.protocol.wakeup(wake_word_phrase)
-                    except Exception as e:
-                        logger.error(f"Failed to trigger wakeup: {e}")
-
-            self._wake_word_callback = on_wake_word
+            self._wake_word_callback = self._on_wake_word
             for detector in self._wake_word_detectors.values():
-                detector.on_wake_word(on_wake_word)
+                detector.on_wake_word(self._on_wake_word)
 
             # Initialize audio recorder (empty preference = system default)
             self._audio_recorder = AudioRecorder(
                 self.api_server.state.preferences.mic_device or None
             )
 
-            # Audio callback for wake word detection
-            def on_audio_chunk(audio_data: bytes):
-                if not self._wake_word_listening:
-                    return
-
-                # Always send audio to voice assistant (handle_audio will check _is_streaming_audio internally)
-                if self.api_server and self.api_server.protocol:
-                    self.api_server.protocol.handle_audio(audio_data)
-
-                # Check if wake word changed
-                if self.api_server and self.api_server.state.wake_words_changed:
-                    self.api_server.state.wake_words_changed = False
-                    self._update_wake_word_detector()
-
-                # Skip wake word detection if TTS is playing (to avoid false positives)
-                if self.api_server and self.api_server.protocol and not self.api_server.protocol._is_playing_tts:
-                    # Pass raw bytes to wake word detectors
-                    for detector in self._wake_word_detectors.values():
-                        detector.process_audio(audio_data)
-
-                if self._stop_word_detector and self.api_server:
-                    stop_word = self.api_server.state.stop_word
-                    stop_is_active = stop_word is not None and stop_word.id in self.api_server.state.active_wake_words
-                    if stop_is_active and self._stop_word_detector.process_audio(audio_data):
-                        self.api_server.protocol.stop()
-
             # Start recording
             self._wake_word_listening = True
-            self._audio_callback = on_audio_chunk
-            self._audio_recorder.start_recording(audio_callback=on_audio_chunk)
+            self._audio_callback = self._on_audio_chunk
+            self._audio_recorder.start_recording(audio_callback=self._on_audio_chunk)
 
             wake_phrases = [det.wake_word_phrase for det in self._wake_word_detectors.values()]
             if wake_phrases:
@@ -418,6 +408,47 @@ class HomeAssistantWindows:
         except Exception as e:
             logger.error(f"Failed to start wake word detection: {e}")
 
+    def _on_wake_word(self, wake_word_phrase: str) -> None:
+        """Wake word detector callback (detector thread)"""
+        now = time.monotonic()
+        # Debounce: ignore if triggered within 2 seconds
+        if now - self._last_wakeup_time < 2.0:
+            return
+        self._last_wakeup_time = now
+
+        logger.info(f"🎤 Wake word detected: {wake_word_phrase}")
+        if self.api_server and self.api_server.protocol:
+            try:
+                self.api_server.protocol.wakeup(wake_word_phrase)
+            except Exception as e:
+                logger.error(f"Failed to trigger wakeup: {e}")
+
+    def _on_audio_chunk(self, audio_data: bytes) -> None:
+        """Recorder callback: stream to Home Assistant and feed the detectors (audio thread)"""
+        if not self._wake_word_listening:
+            return
+
+        # Always send audio to voice assistant (handle_audio will check _is_streaming_audio internally)
+        if self.api_server and self.api_server.protocol:
+            self.api_server.protocol.handle_audio(audio_data)
+
+        # Check if wake word changed
+        if self.api_server and self.api_server.state.wake_words_changed:
+            self.api_server.state.wake_words_changed = False
+            self._update_wake_word_detector()
+
+        # Skip wake word detection if TTS is playing (to avoid false positives)
+        if self.api_server and self.api_server.protocol and not self.api_server.protocol._is_playing_tts:
+            # Pass raw bytes to wake word detectors
+            for detector in self._wake_word_detectors.values():
+                detector.process_audio(audio_data)
+
+        if self._stop_word_detector and self.api_server:
+            stop_word = self.api_server.state.stop_word
+            stop_is_active = stop_word is not None and stop_word.id in self.api_server.state.active_wake_words
+            if stop_is_active and self._stop_word_detector.process_audio(audio_data):
+                self.api_server.protocol.stop()
+
     def _get_active_wake_words(self) -> list[str]:
         """Get active wake words from server state in a stable order"""
         if not self.api_server:
@@ -545,19 +576,17 @@ class HomeAssistantWindows:
             except Exception as e:
                 logger.error(f"Failed to stop tray icon: {e}")
 
-        # Unregister mDNS service
+        # Unregister mDNS service and stop API server; independent, so wait for both at once
+        shutdowns = []
         if self.mdns_broadcaster:
-            try:
-                await self.mdns_broadcaster.unregister_service()
-            except Exception as e:
-                logger.error(f"Failed to unregister mDNS service: {e}")
-
-        # Stop API server
+            shutdowns.append(("unregister mDNS service", self.mdns_broadcaster.unregister_service()))
         if self.api_server:
-            try:
-                await self.api_server.stop()
-            except Exception as e:
-                logger.error(f"Failed to stop API server: {e}")
+            shutdowns.append(("stop API server", self.api_server.stop()))
+
+        results = await asyncio.gather(*(coro for _, coro in shutdowns), return_exceptions=True)
+        for (what, _), result in zip(shutdowns, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to %s: %s", what, result)
 
         logger.info("Cleanup complete, exiting...")
 
@@ -153,6 +153,21 @@ class PlatformBase(ABC):
         """
         pass
     
+    def toggle_autostart(self) -> bool:
+        """
+        Toggle application autostart
+        
+        Platforms can override this to read and write the setting in one step.
+        
+        Returns:
+            bool: New state (True if enabled, False if disabled)
+        """
+        if self.is_autostart_enabled():
+            self.disable_autostart()
+            return False
+        self.enable_autostart()
+        return True
+    
     @abstractmethod
     def get_exe_path(self) -> Optional[str]:
         """
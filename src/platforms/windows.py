@@ -3,17 +3,124 @@ Windows Platform Implementation
 Provides Windows-specific implementations for the platform abstraction layer
 """
 
-import subprocess
+import ctypes
 import winreg
 import sys
 import os
 import logging
+import threading
+from ctypes import wintypes
 from typing import Optional, Dict, List, Callable
 
 from src.platforms.base import PlatformBase, Notification
 
 logger = logging.getLogger(__name__)
 
+# ========== Win32 power / session API (direct calls, no helper processes) ==========
+
+_user32 = ctypes.WinDLL('user32', use_last_error=True)
+_powrprof = ctypes.WinDLL('powrprof', use_last_error=True)
+_advapi32 = ctypes.WinDLL('advapi32', use_last_error=True)
+_kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+
+_user32.LockWorkStation.argtypes = ()
+_user32.LockWorkStation.restype = wintypes.BOOL
+_user32.ExitWindowsEx.argtypes = (wintypes.UINT, wintypes.DWORD)
+_user32.ExitWindowsEx.restype = wintypes.BOOL
+_powrprof.SetSuspendState.argtypes = (wintypes.BOOLEAN, wintypes.BOOLEAN, wintypes.BOOLEAN)
+_powrprof.SetSuspendState.restype = wintypes.BOOLEAN
+_kernel32.GetCurrentProcess.argtypes = ()
+_kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+_kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+_kernel32.CloseHandle.restype = wintypes.BOOL
+
+EWX_LOGOFF = 0x00000000
+EWX_SHUTDOWN = 0x00000001
+EWX_REBOOT = 0x00000002
+EWX_POWEROFF = 0x00000008
+SHTDN_REASON_FLAG_PLANNED = 0x80000000
+
+_TOKEN_ADJUST_PRIVILEGES = 0x0020
+_TOKEN_QUERY = 0x0008
+_SE_PRIVILEGE_ENABLED = 0x00000002
+
+
+class _LUID(ctypes.Structure):
+    _fields_ = [('LowPart', wintypes.DWORD), ('HighPart', wintypes.LONG)]
+
+
+class _TOKEN_PRIVILEGES(ctypes.Structure):
+    """TOKEN_PRIVILEGES with a single LUID_AND_ATTRIBUTES entry"""
+    _fields_ = [('PrivilegeCount', wintypes.DWORD), ('Luid', _LUID), ('Attributes', wintypes.DWORD)]
+
+
+_advapi32.OpenProcessToken.argtypes = (wintypes.HANDLE, wintypes.DWORD, ctypes.POINTER(wintypes.HANDLE))
+_advapi32.OpenProcessToken.restype = wintypes.BOOL
+_advapi32.LookupPrivilegeValueW.argtypes = (wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.POINTER(_LUID))
+_advapi32.LookupPrivilegeValueW.restype = wintypes.BOOL
+_advapi32.AdjustTokenPrivileges.argtypes = (
+    wintypes.HANDLE, wintypes.BOOL, ctypes.POINTER(_TOKEN_PRIVILEGES),
+    wintypes.DWORD, ctypes.c_void_p, ctypes.c_void_p,
+)
+_advapi32.AdjustTokenPrivileges.restype = wintypes.BOOL
+
+_shutdown_privilege_enabled = False
+
+
+def _enable_shutdown_privilege() -> None:
+    """Enable SeShutdownPrivilege for this process (needed for power off, reboot and suspend)"""
+    global _shutdown_privilege_enabled
+    if _shutdown_privilege_enabled:
+        return
+
+    token = wintypes.HANDLE()
+    if not _advapi32.OpenProcessToken(
+        _kernel32.GetCurrentProcess(), _TOKEN_ADJUST_PRIVILEGES | _TOKEN_QUERY, ctypes.byref(token)
+    ):
+        raise ctypes.WinError(ctypes.get_last_error())
+    try:
+        privileges = _TOKEN_PRIVILEGES(1, _LUID(), _SE_PRIVILEGE_ENABLED)
+        if not _advapi32.LookupPrivilegeValueW(None, 'SeShutdownPrivilege', ctypes.byref(privileges.Luid)):
+            raise ctypes.WinError(ctypes.get_last_error())
+        # Succeeds even when the privilege wasn't assigned, so check the last error too
+        adjusted = _advapi32.AdjustTokenPrivileges(token, False, ctypes.byref(privileges), 0, None, None)
+        error = ctypes.get_last_error()
+        if not adjusted or error:
+            raise ctypes.WinError(error)
+    finally:
+        _kernel32.CloseHandle(token)
+    _shutdown_privilege_enabled = True
+
+
+def _exit_windows(flags: int) -> None:
+    """Log off, shut down or reboot via ExitWindowsEx"""
+    if flags != EWX_LOGOFF:
+        _enable_shutdown_privilege()
+    if not _user32.ExitWindowsEx(flags, SHTDN_REASON_FLAG_PLANNED):
+        raise ctypes.WinError(ctypes.get_last_error())
+
+
+def _set_suspend_state(hibernate: bool) -> None:
+    """Call SetSuspendState and log a failure (suspend thread; returns after the system resumes)"""
+    if not _powrprof.SetSuspendState(hibernate, False, False):
+        logger.error("%s failed: %s", "Hibernate" if hibernate else "Sleep", ctypes.WinError(ctypes.get_last_error()))
+
+
+def suspend_system(hibernate: bool) -> None:
+    """
+    Sleep or hibernate via SetSuspendState without blocking the caller
+    Privilege errors are raised here; SetSuspendState itself only returns after
+    the system resumes, so it runs on a daemon thread that logs any failure.
+    """
+    _enable_shutdown_privilege()
+    threading.Thread(target=_set_suspend_state, args=(hibernate,), name='suspend', daemon=True).start()
+
+
+def _lock_workstation() -> None:
+    """Lock the workstation via LockWorkStation"""
+    if not _user32.LockWorkStation():
+        raise ctypes.WinError(ctypes.get_last_error())
+
 
 class WindowsPlatform(PlatformBase):
     """Windows platform implementation"""
@@ -132,14 +239,13 @@ class WindowsPlatform(PlatformBase):
         """
         try:
             import sounddevice as sd
+            devices = sd.query_devices()
             
             # Get all output devices
-            speakers = soundcard.all_speakers()
-            output_devices = [speaker.name for speaker in speakers]
+            output_devices = [d['name'] for d in devices if d['max_output_channels'] > 0]
             
             # Get all input devices
-            mics = soundcard.all_microphones()
-            input_devices = [mic.name for mic in mics]
+            input_devices = [d['name'] for d in devices if d['max_input_channels'] > 0]
             
             logger.info(f"Found {len(output_devices)} output devices, {len(input_devices)} input devices")
             
@@ -270,6 +376,42 @@ class WindowsPlatform(PlatformBase):
             logger.error(f"Failed to check autostart status: {e}")
             return False
     
+    def toggle_autostart(self) -> bool:
+        """
+        Toggle Windows autostart with a single registry open
+        
+        Returns:
+            bool: New state (True if enabled, False if disabled)
+        """
+        exe_path = self.get_exe_path()
+        try:
+            with winreg.OpenKey(
+                winreg.HKEY_LOCAL_MACHINE,
+                self.REGISTRY_KEY,
+                0,
+                winreg.KEY_QUERY_VALUE | winreg.KEY_SET_VALUE
+            ) as key:
+                try:
+                    value, _ = winreg.QueryValueEx(key, self.APP_NAME)
+                except FileNotFoundError:
+                    value = None
+                
+                if value == exe_path:
+                    winreg.DeleteValue(key, self.APP_NAME)
+                    logger.info("Autostart disabled")
+                    return False
+                
+                if not exe_path:
+                    logger.error("Cannot enable autostart: no executable path")
+                    return True
+                winreg.SetValueEx(key, self.APP_NAME, 0, winreg.REG_SZ, exe_path)
+                logger.info(f"Autostart enabled: {exe_path}")
+                return True
+                
+        except OSError:
+            # No write access (non-admin): separate read and write, which log the failure
+            return super().toggle_autostart()
+    
     def get_exe_path(self) -> Optional[str]:
         """
         Get path to running executable
@@ -295,7 +437,7 @@ class WindowsPlatform(PlatformBase):
         """
         try:
             logger.warning("Executing Windows shutdown")
-            subprocess.run(['shutdown', '/s', '/t', '0'], check=True)
+            _exit_windows(EWX_SHUTDOWN | EWX_POWEROFF)
             return True
         except Exception as e:
             logger.error(f"Shutdown failed: {e}")
@@ -310,7 +452,7 @@ class WindowsPlatform(PlatformBase):
         """
         try:
             logger.warning("Executing Windows restart")
-            subprocess.run(['shutdown', '/r', '/t', '0'], check=True)
+            _exit_windows(EWX_REBOOT)
             return True
         except Exception as e:
             logger.error(f"Restart failed: {e}")
@@ -325,7 +467,7 @@ class WindowsPlatform(PlatformBase):
         """
         try:
             logger.info("Executing Windows sleep")
-            subprocess.run(['rundll32.exe', 'powrprof.dll,SetSuspendState', '0,1,0'], check=True)
+            suspend_system(hibernate=False)
             return True
         except Exception as e:
             logger.error(f"Sleep failed: {e}")
@@ -340,7 +482,7 @@ class WindowsPlatform(PlatformBase):
         """
         try:
             logger.info("Executing Windows hibernate")
-            subprocess.run(['shutdown', '/h'], check=True)
+            suspend_system(hibernate=True)
             return True
         except Exception as e:
             logger.error(f"Hibernate failed: {e}")
@@ -355,7 +497,7 @@ class WindowsPlatform(PlatformBase):
         """
         try:
             logger.info("Executing Windows lock screen")
-            subprocess.run(['rundll32.exe', 'user32.dll,LockWorkStation'], check=True)
+            _lock_workstation()
             return True
         except Exception as e:
             logger.error(f"Lock screen failed: {e}")
@@ -370,7 +512,7 @@ class WindowsPlatform(PlatformBase):
         """
         try:
             logger.warning("Executing Windows logoff")
-            subprocess.run(['shutdown', '/l'], check=True)
+            _exit_windows(EWX_LOGOFF)
             return True
         except Exception as e:
             logger.error(f"Logoff failed: {e}")
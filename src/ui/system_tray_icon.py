@@ -9,7 +9,7 @@ import os
 import socket
 import tempfile
 import threading
-from typing import Optional, Callable
+from typing import Callable, Dict, Optional
 
 import pystray
 from PIL import Image, ImageDraw
@@ -54,6 +54,21 @@ _user32 = ctypes.windll.user32
 _shell32 = ctypes.windll.shell32
 
 
+# Tooltip templates (with/without phase) holding the translated IP label, rebuilt after a language change
+_tooltip_formats: Dict[bool, str] = {}
+_i18n.add_language_listener(lambda _language: _tooltip_formats.clear())
+
+
+def _tooltip(info: Dict[str, str], phase: Optional[str] = None) -> str:
+    """Tray tooltip for the status info, including the phase when given"""
+    with_phase = phase is not None
+    fmt = _tooltip_formats.get(with_phase)
+    if fmt is None:
+        head = "HA Windows: {name} [{phase}]" if with_phase else "HA Windows: {name}"
+        fmt = _tooltip_formats[with_phase] = f"{head}\n{_i18n.t('ip_label')}: {{ip}}:{{port}}"
+    return fmt.format(phase=phase, **info)
+
+
 class SystemTrayIcon:
     """
     System Tray Icon Manager
@@ -112,11 +127,7 @@ class SystemTrayIcon:
             hwnd = getattr(self.icon, '_hwnd', None)
             if hwnd:
                 self._replace_icon(hwnd)
-            info = self._status_info
-            self.icon.title = (
-                f"HA Windows: {info['name']} [{phase}]\n"
-                f"{_i18n.t('ip_label')}: {info['ip']}:{info['port']}"
-            )
+            self.icon.title = _tooltip(self._status_info, phase)
 
     def _replace_icon(self, hwnd: int) -> None:
         """Delete and re-add tray icon to force visual update"""
@@ -126,8 +137,7 @@ class SystemTrayIcon:
 
         # Create new icon image
         image = self.create_icon_image()
-        info = self._status_info
-        tip = f"HA Windows: {info['name']} [{self._current_phase}]\n{_i18n.t('ip_label')}: {info['ip']}:{info['port']}"
+        tip = _tooltip(self._status_info, self._current_phase)
 
         fd, path = tempfile.mkstemp('.ico')
         try:
@@ -229,7 +239,7 @@ class SystemTrayIcon:
             )
         )
 
-        self.icon.title = f"HA Windows: {name}\n{_i18n.t('ip_label')}: {ip}:{port if port else 'Unknown'}"
+        self.icon.title = _tooltip(self._status_info)
 
         self._running = True
         self._icon_ready.clear()
@@ -274,10 +284,7 @@ class SystemTrayIcon:
         if port is not None:
             self._status_info['port'] = str(port)
         if self.icon:
-            self.icon.title = (
-                f"HA Windows: {self._status_info['name']}\n"
-                f"{_i18n.t('ip_label')}: {self._status_info['ip']}:{self._status_info['port']}"
-            )
+            self.icon.title = _tooltip(self._status_info)
 
     def set_callbacks(self, on_quit: Callable = None, on_mic_change: Callable = None) -> None:
         self._on_quit = on_quit
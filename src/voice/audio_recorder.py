@@ -6,7 +6,7 @@ Uses sounddevice library to record microphone audio
 import asyncio
 import logging
 import threading
-from typing import Optional, Callable
+from typing import Optional, Callable, Tuple
 from queue import Empty, Full, Queue
 
 import numpy as np
@@ -32,6 +32,8 @@ class AudioRecorder:
         self.audio_queue: Queue[bytes] = Queue(maxsize=200)
         self.recording_thread: Optional[threading.Thread] = None
         self._stream: Optional[sd.InputStream] = None
+        # Scratch arrays reused by _array_to_pcm, reallocated only when the block size changes
+        self._pcm_buffers: Optional[Tuple[np.ndarray, np.ndarray]] = None
 
     @staticmethod
     def list_microphones() -> list[str]:
@@ -179,9 +181,17 @@ class AudioRecorder:
             self.is_recording = False
 
     def _array_to_pcm(self, audio_array: np.ndarray) -> bytes:
-        audio_array = np.squeeze(audio_array)
-        clipped = np.clip(audio_array, -1.0, 1.0)
-        int16_data = (clipped * 32767.0).astype(np.int16)
+        samples = audio_array.reshape(-1)
+        buffers = self._pcm_buffers
+        if buffers is None or buffers[0].shape != samples.shape:
+            buffers = self._pcm_buffers = (
+                np.empty(samples.shape, dtype=np.float32),
+                np.empty(samples.shape, dtype=np.int16),
+            )
+        scratch, int16_data = buffers
+        # Clip, scale and convert in place; tobytes() is the only copy, and the caller keeps it
+        np.clip(samples, -1.0, 1.0, out=scratch)
+        np.multiply(scratch, 32767.0, out=int16_data, casting='unsafe')
         return int16_data.tobytes()
 
     def get_audio_chunk(self, timeout: float = 1.0) -> Optional[bytes]:
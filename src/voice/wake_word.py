@@ -26,8 +26,8 @@ def _normalize_wake_word_phrase(phrase: str) -> str:
 def _should_replace_wake_word(existing: AvailableWakeWord, candidate: AvailableWakeWord) -> bool:
     """Prefer micro wake words over open wake words for identical phrases."""
     return (
-        existing.type == WakeWordType.OPEN_WAKE_WORD
-        and candidate.type == WakeWordType.MICRO_WAKE_WORD
+        existing.type is WakeWordType.OPEN_WAKE_WORD
+        and candidate.type is WakeWordType.MICRO_WAKE_WORD
     )
 
 # Default wake word directory (relative to src/)
@@ -182,7 +182,7 @@ def _load_wake_words_from_directory(wakeword_dir: Path) -> Dict[str, AvailableWa
             ww_type = WakeWordType.MICRO_WAKE_WORD if model_type == 'micro' else WakeWordType.OPEN_WAKE_WORD
             wake_word_path = json_file
 
-            if ww_type == WakeWordType.MICRO_WAKE_WORD:
+            if ww_type is WakeWordType.MICRO_WAKE_WORD:
                 model_file = config.get('model')
                 if model_file:
                     model_path = json_file.parent / model_file
@@ -190,7 +190,7 @@ def _load_wake_words_from_directory(wakeword_dir: Path) -> Dict[str, AvailableWa
                         logger.error(f"MicroWakeWord model file not found: {model_path}")
                         continue
 
-            if ww_type == WakeWordType.OPEN_WAKE_WORD:
+            if ww_type is WakeWordType.OPEN_WAKE_WORD:
                 model_file = config.get('model')
                 if not model_file:
                     logger.error(f"OpenWakeWord config missing model field: {json_file}")
@@ -251,9 +251,9 @@ class WakeWordDetector:
         self._detector_type = wake_word_info.type
 
         # Initialize detector based on type
-        if self._detector_type == WakeWordType.MICRO_WAKE_WORD:
+        if self._detector_type is WakeWordType.MICRO_WAKE_WORD:
             self._init_micro_wakeword(wake_word_info)
-        elif self._detector_type == WakeWordType.OPEN_WAKE_WORD:
+        elif self._detector_type is WakeWordType.OPEN_WAKE_WORD:
             self._init_open_wakeword(wake_word_info)
         else:
             logger.error(f"Unknown wake word type: {self._detector_type}")
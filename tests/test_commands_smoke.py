@@ -0,0 +1,188 @@
+"""
+Smoke Tests for the Command Modules
+
+Replaces the demo `__main__` blocks that used to live in src/commands/*.py:
+media, system, audio and launch commands are driven directly with the OS calls mocked out.
+"""
+
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import src.commands.command_executor as command_executor
+import src.commands.media_commands as media_commands
+import src.commands.system_commands as system_commands
+from src.commands.audio_commands import AudioCommands
+from src.commands.command_executor import CommandExecutor
+from src.commands.media_commands import MediaCommands
+from src.commands.system_commands import SystemCommands
+
+
+class TestMediaCommands:
+    """MediaCommands results and volume handling"""
+
+    def test_set_volume_reports_clamped_volume(self):
+        commands = MediaCommands()
+        with patch.object(MediaCommands, '_apply_volume') as apply_volume:
+            result = commands.set_volume("175")
+
+        assert result['success'] is True
+        assert result['action'] == 'set_volume'
+        assert result['volume'] == 100
+        apply_volume.assert_called_once_with(100)
+
+    @pytest.mark.parametrize("value, expected", [("-5", 0), ("+40", 40), (" 30 ", 30)])
+    def test_set_volume_accepts_signed_values(self, value: str, expected: int):
+        commands = MediaCommands()
+        with patch.object(MediaCommands, '_apply_volume') as apply_volume:
+            result = commands.set_volume(value)
+
+        assert result['success'] is True
+        assert result['volume'] == expected
+        apply_volume.assert_called_once_with(expected)
+
+    @pytest.mark.parametrize("value", ["", "abc", "4.5", "²"])
+    def test_set_volume_rejects_non_numbers(self, value: str):
+        commands = MediaCommands()
+        with patch.object(MediaCommands, '_apply_volume') as apply_volume:
+            result = commands.set_volume(value)
+
+        assert result['success'] is False
+        assert 'error' in result
+        apply_volume.assert_not_called()
+
+    def test_play_pause_toggles(self):
+        commands = MediaCommands()
+
+        assert commands.play_pause()['playing'] is True
+        assert commands.play_pause()['playing'] is False
+
+    def test_results_are_independent_copies(self):
+        commands = MediaCommands()
+        first = commands.next()
+        first['extra'] = True
+
+        assert 'extra' not in commands.next()
+
+    def test_volume_steps_are_coalesced(self):
+        commands = MediaCommands()
+        with patch.object(media_commands, '_run_on_volume_thread') as run_on_volume_thread, \
+                patch.object(media_commands, '_step_master_volume', return_value=33) as step_volume:
+            results = [commands.volume_up() for _ in range(3)]
+            results.append(commands.volume_down())
+            # The queued worker job is replaced by a direct flush, so no real delay is involved
+            run_on_volume_thread.assert_called_once_with(commands._flush_volume_after_delay)
+            commands._flush_volume()
+
+        # One relative change from the real level; the reported level comes from the system
+        step_volume.assert_called_once_with(20)
+        assert commands._volume == 33
+        assert all(result['success'] and 'volume' not in result for result in results)
+
+    def test_volume_step_reads_current_level(self):
+        endpoint = MagicMock()
+        endpoint.GetMasterVolumeLevelScalar.return_value = 0.23
+        with patch.object(media_commands, '_endpoint_volume', return_value=endpoint):
+            assert media_commands._step_master_volume(10) == 33
+            assert media_commands._step_master_volume(-50) == 0
+
+        endpoint.SetMasterVolumeLevelScalar.assert_called_with(0.0, None)
+
+    def test_default_device_change_drops_cached_endpoint(self):
+        pycaw = MagicMock()
+        modules = {'comtypes': MagicMock(), 'pycaw': pycaw, 'pycaw.pycaw': pycaw.pycaw}
+        speakers = pycaw.pycaw.AudioUtilities.GetSpeakers
+        with patch.dict(sys.modules, modules), \
+                patch.object(media_commands, '_register_device_notifications', return_value=object()), \
+                patch.multiple(media_commands, _volume_interface=None, _com_initialized=False,
+                               _device_watcher=None, _volume_interface_stale=False):
+            media_commands._endpoint_volume()
+            media_commands._endpoint_volume()
+            assert speakers.call_count == 1
+
+            media_commands._mark_volume_interface_stale()
+            media_commands._endpoint_volume()
+            assert speakers.call_count == 2
+
+
+class TestSystemCommands:
+    """SystemCommands dispatch to the platform layer and fallbacks"""
+
+    ACTIONS = ('shutdown', 'restart', 'sleep', 'hibernate', 'lock', 'logoff')
+
+    @pytest.mark.parametrize("action", ACTIONS)
+    def test_platform_success(self, action: str):
+        platform = MagicMock()
+        with patch.object(system_commands, 'get_platform_instance', return_value=platform):
+            commands = SystemCommands()
+
+        result = getattr(commands, action)()
+
+        assert result['success'] is True
+        assert result['action'] == action
+
+    @pytest.mark.parametrize("action", ACTIONS)
+    def test_not_supported_without_platform(self, action: str):
+        with patch.object(system_commands, 'get_platform_instance', side_effect=RuntimeError), \
+                patch.object(system_commands, '_IS_WINDOWS', False):
+            commands = SystemCommands()
+
+        result = getattr(commands, action)()
+
+        assert result['success'] is False
+        assert result['action'] == action
+
+    def test_platform_failure_uses_fallback(self):
+        platform = MagicMock()
+        platform.lock_screen.side_effect = OSError("denied")
+        fallback = {'success': True, 'action': 'lock'}
+        with patch.object(system_commands, 'get_platform_instance', return_value=platform), \
+                patch.object(system_commands, '_IS_WINDOWS', True), \
+                patch.object(SystemCommands, '_lock_windows', return_value=fallback):
+            commands = SystemCommands()
+            result = commands.lock()
+
+        assert result is fallback
+
+
+class TestAudioCommands:
+    """AudioCommands device listing"""
+
+    def test_list_devices_uses_sounddevice(self):
+        devices = [
+            {'name': 'Speakers', 'max_output_channels': 2, 'max_input_channels': 0},
+            {'name': 'Microphone', 'max_output_channels': 0, 'max_input_channels': 1},
+        ]
+        sounddevice = MagicMock()
+        sounddevice.query_devices.return_value = devices
+        AudioCommands._invalidate_device_cache()
+
+        with patch.dict(sys.modules, {'sounddevice': sounddevice}):
+            result = AudioCommands._list_devices_soundcard()
+
+        assert result['success'] is True
+        assert result['output_devices'] == ('Speakers',)
+        assert result['input_devices'] == ('Microphone',)
+
+
+class TestLaunchApp:
+    """CommandExecutor launch: program and arguments are split without a shell"""
+
+    def test_windows_passes_arguments_to_startfile(self):
+        executor = CommandExecutor()
+        startfile = MagicMock()
+        with patch.object(command_executor.os, 'startfile', startfile, create=True):
+            result = executor._launch_app(r'"C:\Program Files\App\app.exe" C:\x.txt "two words"')
+
+        assert result['success'] is True
+        startfile.assert_called_once_with(r'C:\Program Files\App\app.exe', arguments=r'C:\x.txt "two words"')
+
+    def test_other_platforms_run_argv_without_shell(self):
+        executor = CommandExecutor()
+        with patch.object(command_executor.os, 'startfile', None, create=True), \
+                patch.object(command_executor.subprocess, 'Popen') as popen:
+            result = executor._launch_app("gedit '/tmp/my notes.txt'")
+
+        assert result['success'] is True
+        popen.assert_called_once_with(['gedit', '/tmp/my notes.txt'])
@@ -519,3 +519,72 @@ class TestAudioStreamingEdgeCases:
         
         assert protocol._is_streaming_audio is False, \
             "Initial streaming state should be False"
+
+    def test_recorder_thread_audio_is_batched_into_one_loop_callback(self):
+        """
+        Audio chunks from a thread other than the event loop's SHALL be queued
+        and sent together from a single loop callback, in order.
+        """
+        protocol = create_test_protocol()
+        protocol._is_streaming_audio = True
+        protocol._loop = MagicMock()
+        protocol._loop_thread_id = -1  # Not the current thread
+
+        sent_messages = []
+        protocol.send_messages = sent_messages.extend
+
+        for chunk in (b"one", b"two", b"three"):
+            protocol.handle_audio(chunk)
+
+        assert sent_messages == []
+        protocol._loop.call_soon_threadsafe.assert_called_once_with(protocol._flush_pending_audio)
+
+        protocol._flush_pending_audio()
+
+        assert [m.data for m in sent_messages] == [b"one", b"two", b"three"]
+        assert protocol._audio_flush_scheduled is False
+
+    def test_audio_overflow_drops_are_counted_and_logged(self, caplog):
+        """
+        When the loop falls behind, the oldest queued chunks SHALL be dropped,
+        and the number of dropped chunks SHALL be logged on the next flush.
+        """
+        protocol = create_test_protocol()
+        protocol._is_streaming_audio = True
+        protocol._loop = MagicMock()
+        protocol._loop_thread_id = -1  # Not the current thread
+
+        sent_messages = []
+        protocol.send_messages = sent_messages.extend
+
+        extra = 3
+        for i in range(protocol.MAX_PENDING_AUDIO_CHUNKS + extra):
+            protocol.handle_audio(str(i).encode())
+
+        with caplog.at_level(logging.WARNING):
+            protocol._flush_pending_audio()
+
+        assert len(sent_messages) == protocol.MAX_PENDING_AUDIO_CHUNKS
+        assert sent_messages[0].data == str(extra).encode()
+        assert protocol._audio_chunks_dropped == extra
+        assert f"dropped {extra} queued audio chunks" in caplog.text
+
+    def test_queued_audio_dropped_after_streaming_stops(self):
+        """
+        Audio queued by the recorder thread SHALL be dropped, not sent,
+        if streaming stopped before the loop flushed it.
+        """
+        protocol = create_test_protocol()
+        protocol._is_streaming_audio = True
+        protocol._loop = MagicMock()
+        protocol._loop_thread_id = -1  # Not the current thread
+
+        sent_messages = []
+        protocol.send_messages = sent_messages.extend
+
+        protocol.handle_audio(b"late")
+        protocol._is_streaming_audio = False
+        protocol._flush_pending_audio()
+
+        assert sent_messages == []
+        assert len(protocol._pending_audio) == 0